@@ -0,0 +1,260 @@
+"""Static page data: model list, templates and HTML/CSS blocks.
+
+Kept out of ``main.py`` so it is compiled once per process instead of on
+every Streamlit rerun.
+"""
+
+import importlib.util
+import os
+
+# Enhanced AI Models with more options
+AI_MODELS = {
+    "OpenRouter - Deepseek (Free)": "deepseek/deepseek-r1-distill-llama-70b:free",
+    "OpenRouter - Mistral 7B": "mistral/mistral-7b-instruct",
+    "OpenRouter - Llama 3.1 8B (Free)": "meta-llama/llama-3.1-8b-instruct:free",
+    "OpenRouter - Qwen 2.5 7B (Free)": "qwen/qwen-2.5-7b-instruct:free",
+    "OpenAI - GPT-3.5": "openai/gpt-3.5-turbo",
+    "OpenAI - GPT-4": "openai/gpt-4",
+    "Anthropic - Claude 3.5 Sonnet": "anthropic/claude-3.5-sonnet"
+}
+
+# Offline models served on CPU by the local backend (see backends.py). They
+# are only offered when llama-cpp-python is installed and
+# PROMPTGEN_LOCAL_MODEL points at a GGUF file.
+LOCAL_MODEL_PREFIX = "local/"
+LOCAL_MODELS = {
+    "Local - Qwen 2.5 0.5B (Free, Offline)": "local/qwen2.5-0.5b-instruct-q4_k_m"
+}
+LOCAL_CONTEXT = int(os.environ.get("PROMPTGEN_LOCAL_CONTEXT", "8192"))
+
+if os.path.isfile(os.environ.get("PROMPTGEN_LOCAL_MODEL", "")) and importlib.util.find_spec("llama_cpp"):
+    AI_MODELS.update(LOCAL_MODELS)
+
+# Sidebar option that lets the model router pick among the free models
+AUTO_MODEL = "🤖 Auto (เลือกอัตโนมัติ)"
+
+# Completion budget requested per enhancement
+MAX_TOKENS = 4000
+
+# System instructions sent ahead of each framework prompt
+FRAMEWORK_INSTRUCTIONS = {
+    "RACE": """ปรับปรุงโครงสร้างและภาษาของ Prompt นี้ให้เป็นมืออาชีพมากขึ้น โดย:
+1. คงโครงสร้าง RACE Framework ดั้งเดิม
+2. ปรับภาษาให้ชัดเจนและเป็นมืออาชีพ
+3. เพิ่มรายละเอียดที่จำเป็น
+4. ตรวจสอบความสมบูรณ์ของแต่ละส่วน
+5. จัดรูปแบบให้อ่านง่าย""",
+    
+    "BUILD": """ปรับปรุงและพัฒนา Web App Specification นี้ให้เป็นมืออาชีพและละเอียดมากขึ้น โดย:
+1. คงโครงสร้าง BUILD Framework ดั้งเดิม
+2. เสนอแนะเทคนิค UI/UX และ Code Structure ที่เหมาะสม
+3. เพิ่มรายละเอียดทางเทคนิคที่จำเป็น
+4. แนะนำ best practices สำหรับการพัฒนา
+5. ระบุข้อควรพิจารณาด้านความปลอดภัยและประสิทธิภาพ"""
+}
+
+# Enhanced RACE Templates with more variety
+RACE_TEMPLATES = {
+    "Streamlit App Developer": {
+        "role": "คุณคือนักพัฒนา Python ที่เชี่ยวชาญในการสร้างแอพพลิเคชันด้วย Streamlit และมีประสบการณ์ในการพัฒนา web application มากกว่า 5 ปี มีความเข้าใจลึกในด้าน UI/UX และ data visualization",
+        "action": "ออกแบบและพัฒนาแอพพลิเคชัน Streamlit ที่มีประสิทธิภาพ ใช้งานง่าย และมีฟีเจอร์ครบถ้วนตามความต้องการ พร้อมให้คำแนะนำด้าน best practices",
+        "context": "กำลังพัฒนาแอพพลิเคชันสำหรับการวิเคราะห์และแสดงผลข้อมูล โดยต้องการให้ผู้ใช้สามารถอัพโหลดไฟล์ จัดการข้อมูล และดูผลการวิเคราะห์ได้ อีกทั้งต้องรองรับผู้ใช้ที่มีความรู้ทางเทคนิคแตกต่างกัน",
+        "explanation": """โครงสร้างแอพพลิเคชันประกอบด้วย:
+1. ส่วนอัพโหลดและจัดการข้อมูล (File upload, validation, preview)
+2. ส่วนประมวลผลและวิเคราะห์ (Data processing, statistical analysis)
+3. ส่วนแสดงผลและ visualization (Charts, tables, interactive plots)
+4. ระบบจัดการ state และ cache (Session state, data caching)
+5. Error handling และ user feedback""",
+        "example_output": """# โครงสร้างโค้ด Streamlit แบบละเอียด
+1. การตั้งค่าเริ่มต้น (Page config, imports, constants)
+2. ฟังก์ชันหลัก (Main functions, data processing)
+3. UI Components (Sidebar, main area, tabs)
+4. การจัดการข้อมูล (Upload, validation, transformation)
+5. การแสดงผล (Visualizations, tables, metrics)
+6. Export และ download features""",
+        "tips": """1. ใช้ st.cache_data สำหรับฟังก์ชันที่ประมวลผลนาน
+2. จัดการ state ด้วย session_state อย่างมีประสิทธิภาพ
+3. แบ่ง code เป็นโมดูลที่จัดการง่าย
+4. ใช้ try-except สำหรับ error handling
+5. เพิ่ม progress bar สำหรับ long-running processes
+6. ใช้ columns และ containers เพื่อจัด layout
+7. เพิ่ม help text และ tooltips สำหรับ user guidance"""
+    },
+    "Data Analyst AI": {
+        "role": "คุณคือนักวิเคราะห์ข้อมูลมืออาชีพที่มีความเชี่ยวชาญในการใช้ Python, Pandas, และเครื่องมือวิเคราะห์ข้อมูลขั้นสูง สามารถแปลงข้อมูลซับซ้อนให้เป็น insights ที่เข้าใจง่าย",
+        "action": "วิเคราะห์ข้อมูลอย่างละเอียด สร้าง visualization ที่มีความหมาย และสรุปผลเป็น actionable insights พร้อมคำแนะนำเชิงธุรกิจ",
+        "context": "ทำงานกับข้อมูลธุรกิจที่หลากหลาย ตั้งแต่ sales data, customer behavior, จนถึง operational metrics สำหรับองค์กรที่ต้องการ data-driven decisions",
+        "explanation": """การวิเคราะห์ครอบคลุม:
+1. Exploratory Data Analysis (EDA)
+2. Statistical analysis และ hypothesis testing
+3. Trend analysis และ forecasting
+4. Customer segmentation และ behavior analysis
+5. Performance metrics และ KPI tracking""",
+        "example_output": """# รายงานการวิเคราะห์ข้อมูล
+## Executive Summary
+## Key Findings
+## Detailed Analysis
+## Visualizations
+## Recommendations
+## Next Steps""",
+        "tips": """1. เริ่มด้วย data quality assessment
+2. ใช้ visualization เพื่อ storytelling
+3. ระบุ patterns และ anomalies
+4. เชื่อมโยงผลวิเคราะห์กับ business objectives
+5. ให้คำแนะนำที่ actionable"""
+    },
+    "Technical Writer": {
+        "role": "คุณคือนักเขียนเทคนิคมืออาชีพที่มีความเชี่ยวชาญในการแปลงข้อมูลทางเทคนิคที่ซับซ้อนให้เป็นเอกสารที่เข้าใจง่าย สำหรับผู้อ่านที่มีระดับความรู้แตกต่างกัน",
+        "action": "สร้างเอกสารทางเทคนิคที่มีคุณภาพ ครอบคลุม user manuals, API documentation, tutorials, และ technical specifications",
+        "context": "ทำงานในองค์กรเทคโนโลジีที่ต้องการเอกสารคุณภาพสูงสำหรับผลิตภัณฑ์ซอฟต์แวร์ API และระบบต่างๆ",
+        "explanation": """ประเภทเอกสารที่สร้าง:
+1. User documentation และ help guides
+2. API documentation และ developer guides
+3. Technical specifications และ architecture docs
+4. Tutorial และ how-to guides
+5. Troubleshooting และ FAQ""",
+        "example_output": """# Technical Documentation Structure
+## Overview
+## Getting Started
+## Detailed Instructions
+## Code Examples
+## Troubleshooting
+## FAQs
+## References""",
+        "tips": """1. เริ่มด้วย audience analysis
+2. ใช้โครงสร้างที่ชัดเจนและ logical
+3. เพิ่ม code examples และ screenshots
+4. ทดสอบคำแนะนำกับ real users
+5. Update เอกสารให้ทันสมัยเสมอ"""
+    }
+}
+
+# Enhanced BUILD Templates
+BUILD_TEMPLATES = {
+    "E-commerce Platform": {
+        "background": "ต้องการพัฒนาแพลตฟอร์ม E-commerce สำหรับร้านค้าออนไลน์ขนาดกลาง ที่ต้องการขายสินค้าหลากหลายประเภทและจัดการคำสั่งซื้ออย่างมีประสิทธิภาพ มีเป้าหมายรองรับลูกค้า 10,000+ คนและการขายผ่านหลายช่องทาง",
+        "user": "เจ้าของร้านค้า (Admin), พนักงาน (Staff), และลูกค้า (Customer) โดยลูกค้าส่วนใหญ่เป็นคนรุ่นใหม่ที่คุ้นเคยกับเทคโนโลยี แต่ต้องการความสะดวกและรวดเร็ว ใช้งานผ่าน mobile มากกว่า desktop",
+        "interface": "UI/UX ที่ทันสมัย responsive design รองรับทั้ง desktop และ mobile ใช้สีโทนเขียว-ขาว เน้นความเรียบง่ายแต่สวยงาม มี search bar เด่นชัด navigation ที่ชัดเจน และ micro-interactions ที่เพิ่มความน่าใช้",
+        "logic": """ฟีเจอร์หลัก:
+- ระบบจัดการสินค้า (CRUD) พร้อม bulk operations
+- ระบบตะกร้าสินค้าและ checkout แบบ multi-step
+- ระบบชำระเงินหลายช่องทาง (Credit Card, Mobile Banking, E-Wallet)
+- ระบบจัดการคำสั่งซื้อและ order tracking
+- ระบบรีวิวและ rating พร้อม photo uploads
+- ระบบแจ้งเตือนสต็อกและ price alerts
+- Dashboard สำหรับ admin พร้อม analytics
+- ระบบ promotions และ discount codes
+- Integration กับ shipping providers""",
+        "development": """Tech Stack:
+Frontend: React.js + Next.js + Tailwind CSS + Framer Motion
+Backend: Node.js + Express.js + TypeScript
+Database: PostgreSQL + Redis (Caching)
+Payment: Stripe + Omise (Local payments)
+File Storage: AWS S3 + CloudFront CDN
+Search: Elasticsearch
+Hosting: Vercel (Frontend) + AWS ECS (Backend)
+Monitoring: Sentry + DataDog
+Additional: JWT Authentication, Socket.io (Real-time), PWA support"""
+    },
+    "SaaS Dashboard": {
+        "background": "พัฒนา SaaS dashboard สำหรับ analytics และ business intelligence ที่ต้องการแสดงข้อมูลซับซ้อนในรูปแบบที่เข้าใจง่าย รองรับ multi-tenancy และ real-time data updates",
+        "user": "Business analysts, Data scientists, และ C-level executives ที่ต้องการ insights จากข้อมูลเพื่อการตัดสินใจ มีความรู้ด้านข้อมูลปานกลางถึงสูง",
+        "interface": "Dark theme professional design ใช้สี navy blue และ accent colors แบบ minimal มี data visualization ที่โดดเด่น responsive สำหรับ large screens และ customizable dashboards",
+        "logic": """ฟีเจอร์หลัก:
+- Real-time data visualization (Charts, Graphs, Heatmaps)
+- Custom dashboard builder (Drag & Drop)
+- Advanced filtering และ drill-down capabilities
+- Report generation และ scheduling
+- User management และ role-based permissions
+- API integration สำหรับ external data sources
+- Alert system สำหรับ threshold monitoring
+- Export capabilities (PDF, Excel, CSV)
+- Data collaboration tools""",
+        "development": """Tech Stack:
+Frontend: Vue.js 3 + Composition API + Vuetify + D3.js
+Backend: Python + FastAPI + SQLAlchemy
+Database: PostgreSQL + ClickHouse (Analytics) + Redis
+Real-time: WebSockets + Server-Sent Events
+Visualization: D3.js + Chart.js + Plotly
+Hosting: Digital Ocean + Kubernetes
+Monitoring: Prometheus + Grafana
+Additional: OAuth 2.0, Multi-tenancy, Data Pipeline (Apache Airflow)"""
+    },
+    "Learning Management System": {
+        "background": "พัฒนาแพลตฟอร์มการเรียนรู้ออนไลน์สำหรับโรงเรียนและมหาวิทยาลัย ที่ต้องการจัดการคอร์สเรียน ติดตามผลการเรียน และสื่อสารระหว่างครูและนักเรียน รองรับการเรียนการสอนแบบ hybrid",
+        "user": "ครู/อาจารย์ (สร้างเนื้อหา), นักเรียน/นักศึกษา (เรียนและทำแบบทดสอบ), ผู้ปกครอง (ติดตามผล), และ admin (จัดการระบบ) ครอบคลุมทุกช่วงอายุและระดับความรู้ด้านเทคโนโลยี",
+        "interface": "Design ที่เป็นมิตรและอบอุ่น ใช้สีฟ้าอ่อน-ส้ม adaptive design ที่ปรับตาม device และ accessibility features สำหรับผู้พิการ รองรับ multiple languages",
+        "logic": """ฟีเจอร์หลัก:
+- ระบบจัดการคอร์สและบทเรียนแบบ modular
+- ระบบอัพโหลด video, audio และเอกสารหลายรูปแบบ
+- ระบบสร้างแบบทดสอบและ assignments แบบ adaptive
+- ระบบ video conferencing สำหรับ live classes
+- ระบบ chat, forum และ discussion boards  
+- ระบบ calendar และ assignment scheduling
+- ระบบ gradebook และ progress tracking
+- ระบบ notification และ reminder
+- ระบบ plagiarism detection
+- Mobile app สำหรับการเรียนขณะเดินทาง""",
+        "development": """Tech Stack:
+Frontend: React.js + Next.js + Chakra UI + PWA
+Backend: Node.js + NestJS + GraphQL
+Database: MongoDB + PostgreSQL (Hybrid)
+Video: AWS IVS + Zoom SDK + HLS streaming
+Storage: AWS S3 + CloudFront
+Real-time: Socket.io + Redis Pub/Sub
+Search: Algolia
+Hosting: AWS (Multi-region)
+Mobile: React Native + Expo
+Additional: WebRTC, ML-based content recommendation, SCORM compliance"""
+    }
+}
+
+# Custom CSS for better styling
+CUSTOM_CSS = """
+<style>
+    .main-header {
+        background: linear-gradient(135deg, #667eea 0%, #764ba2 100%);
+        padding: 2rem;
+        border-radius: 10px;
+        margin-bottom: 2rem;
+        text-align: center;
+        color: white;
+    }
+    .framework-tab {
+        background-color: #f8f9fa;
+        padding: 1rem;
+        border-radius: 8px;
+        margin-bottom: 1rem;
+    }
+    .tips-box {
+        background-color: #e8f4fd;
+        border-left: 4px solid #0066cc;
+        padding: 1rem;
+        margin: 1rem 0;
+        border-radius: 4px;
+    }
+    .stTextArea textarea {
+        font-family: 'SF Mono', Monaco, 'Cascadia Code', 'Roboto Mono', Consolas, 'Courier New', monospace;
+    }
+</style>
+"""
+
+# Enhanced header
+HEADER_HTML = """
+<div class="main-header">
+    <h1>🚀 Multi-Framework Prompt Generator</h1>
+    <p>สร้าง Prompt ระดับมืออาชีพด้วย RACE & BUILD Framework</p>
+    <small>✨ Powered by Advanced AI Models | 🛡️ Enhanced Error Handling | 🚀 Professional Templates</small>
+</div>
+"""
+
+# Enhanced footer
+FOOTER_HTML = """
+<div style='text-align: center; color: #666; padding: 2rem;'>
+    <h4>🚀 Multi-Framework Prompt Generator</h4>
+    <p>💡 <strong>เคล็ดลับ:</strong> ใช้ RACE สำหรับ General AI Prompts และ BUILD สำหรับ Web App Development</p>
+    <p>🤖 Powered by OpenRouter AI Models | 🛡️ Enhanced Error Handling | ✨ Professional Templates</p>
+    <p>📧 <strong>ต้องการความช่วยเหลือ?</strong> ดูคู่มือการใช้งานในแท็บ "📚 คู่มือการใช้งาน"</p>
+    <small>Version 2.0 | Built with ❤️ using Streamlit</small>
+</div>
+"""
@@ -0,0 +1,114 @@
+"""Completion backends behind ``call_openrouter_api``.
+
+Every backend exposes ``post(url, headers, json, timeout)`` and returns a
+``requests.Response`` shaped like an OpenRouter chat completion. Retries,
+error messages, caching, router stats and lifecycle logging therefore work
+unchanged whichever backend serves a model.
+
+* OpenRouter models use the HTTP ``transport`` (live, record or replay).
+* ``local/...`` models run on CPU in-process through ``llama-cpp-python``
+  (optional dependency), standing in for a local OpenAI-compatible server.
+  The GGUF weights at ``PROMPTGEN_LOCAL_MODEL`` are loaded once per process
+  and shared by all sessions. One llama.cpp context cannot serve two
+  generations at once, so local calls queue in their own single-slot
+  scheduler and never hold the upstream slots OpenRouter calls need. Each
+  generation is capped at ``LOCAL_MAX_TOKENS`` and stopped at the request
+  timeout.
+"""
+
+import os
+import threading
+import time
+from json import dumps
+
+from assets import LOCAL_CONTEXT, LOCAL_MODEL_PREFIX
+from scheduler import local_scheduler, scheduler
+from transport import build_response, transport
+
+# Generated tokens per local request; CPU generation is slow
+LOCAL_MAX_TOKENS = 1024
+
+_model = None
+_load_lock = threading.Lock()
+_infer_lock = threading.Lock()
+
+
+def _load_model():
+    global _model
+    if _model is None:
+        with _load_lock:
+            if _model is None:
+                from llama_cpp import Llama
+
+                _model = Llama(
+                    model_path=os.environ["PROMPTGEN_LOCAL_MODEL"],
+                    n_ctx=LOCAL_CONTEXT,
+                    n_threads=os.cpu_count(),
+                    n_gpu_layers=0,
+                    verbose=False,
+                )
+    return _model
+
+
+class LocalBackend:
+    """In-process llama.cpp model answering OpenAI-style chat requests"""
+
+    def __init__(self):
+        self.requests_sent = 0
+
+    def post(self, url, headers, json, timeout):
+        self.requests_sent += 1
+        started = time.perf_counter()
+        try:
+            model = _load_model()
+        except Exception as e:
+            return self._error(url, 503, "Service Unavailable", "local_model_unavailable",
+                               f"{type(e).__name__}: {e}")
+
+        first_byte_ms = None
+        parts = []
+        with _infer_lock:
+            stream = model.create_chat_completion(
+                messages=json["messages"],
+                temperature=json["temperature"],
+                top_p=json["top_p"],
+                max_tokens=min(json["max_tokens"], LOCAL_MAX_TOKENS),
+                stream=True,
+            )
+            try:
+                for chunk in stream:
+                    delta = chunk["choices"][0]["delta"].get("content")
+                    if delta:
+                        if first_byte_ms is None:
+                            first_byte_ms = (time.perf_counter() - started) * 1000
+                        parts.append(delta)
+                    if time.perf_counter() - started > timeout:
+                        return self._error(url, 504, "Gateway Timeout", "local_timeout",
+                                           f"Local generation exceeded {timeout}s")
+            finally:
+                # Stops llama.cpp generating once we stop reading
+                stream.close()
+
+        body = {
+            "model": json["model"],
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": "".join(parts)}}],
+        }
+        return build_response(url, 200, "OK", {"Content-Type": "application/json"},
+                              dumps(body, ensure_ascii=False).encode("utf-8"), first_byte_ms or 0)
+
+    def _error(self, url, status, reason, code, message):
+        body = dumps({"error": {"code": code, "message": message}}, ensure_ascii=False).encode("utf-8")
+        return build_response(url, status, reason, {"Content-Type": "application/json"}, body, 0)
+
+
+local_backend = LocalBackend()
+
+
+def backend_for(model_id):
+    """Backend serving ``model_id`` (an ``AI_MODELS`` value)"""
+    return local_backend if model_id.startswith(LOCAL_MODEL_PREFIX) else transport
+
+
+def scheduler_for(model_id):
+    """Admission queue for calls to ``model_id``"""
+    return local_scheduler if model_id.startswith(LOCAL_MODEL_PREFIX) else scheduler
@@ -0,0 +1,198 @@
+"""Offline performance regression check for the RACE and BUILD flows.
+
+Runs every bundled template through ``call_openrouter_api`` end to end,
+against exchanges recorded by ``transport``'s record mode, and compares
+per-flow latency, peak allocations and retry count with a stored baseline.
+Exits non-zero when any flow regresses past its threshold. One untimed
+warm-up flow runs first, so one-time import and cache costs don't land on
+the first measured flow.
+
+    # capture fixtures from the live API (needs OPENROUTER_API_KEY)
+    python benchmarks/regression.py --record
+    # accept the current numbers as the new baseline
+    python benchmarks/regression.py --update-baseline
+    # offline check, e.g. in CI
+    python benchmarks/regression.py
+
+The committed synthetic fixture (canned responses with fixed timings) backs
+``tests/test_regression.py``; regenerate it and its baseline when templates
+or prompts change:
+
+    python benchmarks/regression.py --synthesize
+    python benchmarks/regression.py --fixtures benchmarks/fixtures/synthetic.jsonl \\
+        --baseline benchmarks/synthetic_baseline.json --update-baseline
+"""
+
+import argparse
+import json
+import logging
+import os
+import sys
+import time
+import tracemalloc
+import warnings
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "openrouter.jsonl")
+BASELINE = os.path.join(ROOT, "benchmarks", "regression_baseline.json")
+SYNTHETIC_FIXTURES = os.path.join(ROOT, "benchmarks", "fixtures", "synthetic.jsonl")
+SYNTHETIC_BASELINE = os.path.join(ROOT, "benchmarks", "synthetic_baseline.json")
+
+# Arrival offsets of the two body chunks in a synthetic exchange
+SYNTHETIC_CHUNK_MS = (20, 40)
+
+# Allowed growth over the baseline before a flow counts as regressed
+LATENCY_TOLERANCE = 0.25
+LATENCY_SLACK_SECONDS = 0.05
+ALLOCATION_TOLERANCE = 0.5
+
+
+def flows():
+    """(name, framework, prompt) for every bundled template"""
+    from assets import BUILD_TEMPLATES, RACE_TEMPLATES
+    from prompts import build_build_spec, build_race_prompt
+
+    for name, fields in RACE_TEMPLATES.items():
+        yield f"RACE/{name}", "RACE", build_race_prompt(fields)
+    for name, fields in BUILD_TEMPLATES.items():
+        yield f"BUILD/{name}", "BUILD", build_build_spec(fields)
+
+
+def synthesize(path, model_name):
+    """Write one canned 200 exchange per flow, with fixed chunk timings"""
+    from openrouter_client import build_payload
+    from transport import request_key
+
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    with open(path, "w", encoding="utf-8") as fh:
+        for name, framework_type, prompt in flows():
+            content = f"## {name} (enhanced)\n\n{prompt}"
+            body = json.dumps({"choices": [{"index": 0, "message": {"role": "assistant", "content": content}}]},
+                              ensure_ascii=False)
+            half = len(body) // 2
+            entry = {
+                "key": request_key(build_payload(prompt, model_name, framework_type, 0.7)),
+                "status": 200,
+                "reason": "OK",
+                "headers": {"Content-Type": "application/json"},
+                "chunks": [[SYNTHETIC_CHUNK_MS[0], body[:half]], [SYNTHETIC_CHUNK_MS[1], body[half:]]],
+            }
+            fh.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+def run(model_name, api_key):
+    from openrouter_client import call_openrouter_api
+    from transport import transport
+
+    if hasattr(transport, "rewind"):
+        # Untimed warm-up, then replay state as if it never ran
+        _, framework_type, prompt = next(flows())
+        call_openrouter_api(prompt, api_key, model_name, framework_type, session_id="warmup")
+        transport.rewind()
+
+    results = {}
+    tracemalloc.start()
+    for name, framework_type, prompt in flows():
+        sent_before = transport.requests_sent
+        tracemalloc.reset_peak()
+        baseline_mem = tracemalloc.get_traced_memory()[0]
+        started = time.perf_counter()
+        output = call_openrouter_api(prompt, api_key, model_name, framework_type, session_id="regression")
+        latency = time.perf_counter() - started
+        peak = tracemalloc.get_traced_memory()[1] - baseline_mem
+        results[name] = {
+            "ok": output is not None,
+            "latency_s": round(latency, 3),
+            "peak_kib": round(peak / 1024, 1),
+            "retries": transport.requests_sent - sent_before - 1,
+        }
+    tracemalloc.stop()
+    return results
+
+
+def compare(results, baseline):
+    """Human-readable regressions of ``results`` against ``baseline``"""
+    failures = []
+    for name, current in results.items():
+        expected = baseline.get(name)
+        if expected is None:
+            failures.append(f"{name}: no baseline (run with --update-baseline)")
+            continue
+        if expected["ok"] and not current["ok"]:
+            failures.append(f"{name}: flow failed")
+        latency_limit = expected["latency_s"] * (1 + LATENCY_TOLERANCE) + LATENCY_SLACK_SECONDS
+        if current["latency_s"] > latency_limit:
+            failures.append(f"{name}: latency {current['latency_s']}s > {latency_limit:.3f}s")
+        memory_limit = expected["peak_kib"] * (1 + ALLOCATION_TOLERANCE)
+        if current["peak_kib"] > memory_limit:
+            failures.append(f"{name}: peak allocations {current['peak_kib']} KiB > {memory_limit:.1f} KiB")
+        if current["retries"] > expected["retries"]:
+            failures.append(f"{name}: retries {current['retries']} > {expected['retries']}")
+    return failures
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--record", action="store_true", help="call the live API and rewrite the fixtures")
+    parser.add_argument("--synthesize", action="store_true",
+                        help="write canned fixtures for every flow (to --fixtures, default the synthetic file)")
+    parser.add_argument("--update-baseline", action="store_true", help="store this run as the new baseline")
+    parser.add_argument("--model", help="AI_MODELS display name (defaults to the first one)")
+    parser.add_argument("--fixtures")
+    parser.add_argument("--baseline", default=BASELINE)
+    args = parser.parse_args()
+
+    if args.synthesize:
+        sys.path.insert(0, ROOT)
+        from assets import AI_MODELS
+
+        path = args.fixtures or SYNTHETIC_FIXTURES
+        synthesize(path, args.model or next(iter(AI_MODELS)))
+        print(f"wrote {path}")
+        return 0
+    args.fixtures = args.fixtures or FIXTURES
+
+    if args.record:
+        api_key = os.environ.get("OPENROUTER_API_KEY")
+        if not api_key:
+            parser.error("--record needs OPENROUTER_API_KEY")
+        if os.path.exists(args.fixtures):
+            os.remove(args.fixtures)
+        os.environ["PROMPTGEN_HTTP_MODE"] = "record"
+    else:
+        if not os.path.exists(args.fixtures):
+            parser.error(f"no fixtures at {args.fixtures}; record them first with --record")
+        api_key = "replay"
+        os.environ["PROMPTGEN_HTTP_MODE"] = "replay"
+    os.environ["PROMPTGEN_FIXTURES"] = args.fixtures
+
+    # Streamlit runs in bare mode here; its "no runtime" warnings are noise
+    warnings.simplefilter("ignore")
+    logging.disable(logging.WARNING)
+    sys.path.insert(0, ROOT)
+    from assets import AI_MODELS
+
+    results = run(args.model or next(iter(AI_MODELS)), api_key)
+    for name, row in results.items():
+        print(f"{name:<45} {'ok' if row['ok'] else 'FAIL':<5} {row['latency_s']:>8.3f}s "
+              f"{row['peak_kib']:>10.1f} KiB  retries={row['retries']}")
+
+    if args.record:
+        return 0
+    if args.update_baseline:
+        with open(args.baseline, "w", encoding="utf-8") as fh:
+            json.dump(results, fh, ensure_ascii=False, indent=2)
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"no baseline at {args.baseline}; create one with --update-baseline")
+        return 1
+    with open(args.baseline, encoding="utf-8") as fh:
+        failures = compare(results, json.load(fh))
+    for failure in failures:
+        print(f"REGRESSION {failure}")
+    return 1 if failures else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
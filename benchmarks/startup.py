@@ -0,0 +1,108 @@
+"""Cold-start benchmark: import time and time-to-first-render.
+
+Every measurement runs in a fresh interpreter so nothing is served from an
+already-populated ``sys.modules``. Time-to-first-render executes ``main.py``
+once without a server, under a fresh script-run context and session state,
+which is the same script run a new session triggers. It reports whether the
+HTTP stack got imported and how many elements were sent to the browser.
+
+    python benchmarks/startup.py --repeat 7 --output bench_output.txt
+"""
+
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import time
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+IMPORT_TARGETS = ["streamlit", "requests", "assets", "openrouter_client"]
+
+IMPORT_SNIPPET = """
+import time
+t = time.perf_counter()
+import {module}
+print(time.perf_counter() - t)
+"""
+
+RENDER_SNIPPET = """
+import logging, runpy, sys, threading, time, warnings
+warnings.simplefilter("ignore")
+logging.disable(logging.CRITICAL)
+t = time.perf_counter()
+from streamlit.runtime.scriptrunner import ScriptRunContext, add_script_run_ctx
+from streamlit.runtime.state import SafeSessionState, SessionState
+from streamlit.runtime.uploaded_file_manager import UploadedFileManager
+messages = []
+ctx = ScriptRunContext(
+    session_id="bench", _enqueue=messages.append, query_string="",
+    session_state=SafeSessionState(SessionState()), uploaded_file_mgr=UploadedFileManager(),
+    page_script_hash="", user_info={"email": "bench@localhost"},
+)
+add_script_run_ctx(threading.current_thread(), ctx)
+# Forms only resolve their ids when a server runtime exists
+import streamlit.runtime
+streamlit.runtime.exists = lambda: True
+runpy.run_path("main.py", run_name="__main__")
+elapsed = time.perf_counter() - t
+print(elapsed, int("requests" in sys.modules), len(messages))
+"""
+
+
+def _run(snippet):
+    out = subprocess.run(
+        [sys.executable, "-c", snippet],
+        cwd=ROOT,
+        capture_output=True,
+        text=True,
+    )
+    if out.returncode:
+        raise SystemExit(f"benchmark run failed:\n{out.stderr}")
+    return out.stdout.strip().splitlines()[-1].split()
+
+
+def measure(repeat):
+    """Return median timings (in ms) over ``repeat`` fresh interpreters"""
+    results = {"imports_ms": {}, "first_render_ms": None, "http_stack_loaded": None, "messages": None}
+
+    for module in IMPORT_TARGETS:
+        samples = [float(_run(IMPORT_SNIPPET.format(module=module))[0]) for _ in range(repeat)]
+        results["imports_ms"][module] = round(statistics.median(samples) * 1000, 1)
+
+    samples, loaded = [], set()
+    for _ in range(repeat):
+        elapsed, has_requests, messages = _run(RENDER_SNIPPET)
+        samples.append(float(elapsed))
+        loaded.add(has_requests == "1")
+        results["messages"] = int(messages)
+    results["first_render_ms"] = round(statistics.median(samples) * 1000, 1)
+    results["http_stack_loaded"] = any(loaded)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--repeat", type=int, default=5, help="fresh interpreters per measurement")
+    parser.add_argument("--output", help="append the result as one JSON line to this file")
+    args = parser.parse_args()
+
+    results = measure(args.repeat)
+    results["timestamp"] = time.strftime("%Y-%m-%dT%H:%M:%S")
+    results["python"] = sys.version.split()[0]
+
+    for module, ms in results["imports_ms"].items():
+        print(f"import {module:<20} {ms:>8.1f} ms")
+    print(f"{'first render':<27} {results['first_render_ms']:>8.1f} ms")
+    print(f"{'HTTP stack on first render':<27} {'yes' if results['http_stack_loaded'] else 'no':>8}")
+    print(f"{'messages on first render':<27} {results['messages']:>8}")
+
+    if args.output:
+        with open(args.output, "a", encoding="utf-8") as fh:
+            fh.write(json.dumps(results) + "\n")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,179 @@
+"""Map-reduce enhancement of prompts too long for a single request.
+
+Only prompts that don't fit the model's context are split; anything that
+fits goes out as one request, unchanged. The prompt is split along its
+markdown sections, then paragraphs, then lines, into chunks well below the
+context, and the chunks are enhanced in parallel, so the map phase takes
+about as long as the slowest chunk. A short reduce pass then writes an
+overview from an outline of the enhanced parts: scope, the terms every
+part should use, and where parts conflict. The parts themselves are not
+rewritten, so the result is sectioned (overview, then the parts separated
+by ``---``) and is never bounded by one response's output cap.
+"""
+
+import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+
+import requests
+
+from assets import FRAMEWORK_INSTRUCTIONS, MAX_TOKENS
+from openrouter_client import build_headers, build_payload, request_completion
+from response_cache import cache, cache_key
+from scheduler import INTERACTIVE
+from token_counter import MESSAGE_OVERHEAD, count_tokens, estimate_request, model_spec
+
+# Input size per chunk; enhanced output is typically 1.5-2x the input
+CHUNK_TOKENS = 1500
+
+MAX_PARALLEL_CHUNKS = 6
+
+# Attempts per map call; transient failures back off 1 s, then 2 s
+MAP_ATTEMPTS = 3
+
+# Characters of each enhanced part shown to the reduce pass
+OUTLINE_CHARS = 600
+
+MAP_INSTRUCTION = """{framework_instruction}
+
+นี่คือส่วนที่ {index}/{total} ของเอกสารที่ยาว ให้ปรับปรุงเฉพาะส่วนนี้:
+- คงหัวข้อ (markdown headings) เดิมของส่วนนี้ไว้
+- ไม่ต้องเขียนบทนำ บทสรุป หรืออ้างถึงส่วนอื่น
+- ตอบเฉพาะเนื้อหาที่ปรับปรุงแล้ว"""
+
+REDUCE_INSTRUCTION = """ด้านล่างคือโครงร่างของเอกสาร {framework} ที่ถูกปรับปรุงแยกเป็น {total} ส่วน
+เขียน "ภาพรวม" สั้นๆ ที่จะวางไว้ต้นเอกสาร โดย:
+1. สรุปเป้าหมายและขอบเขตของทั้งเอกสาร
+2. กำหนดคำศัพท์/ชื่อเรียกที่ต้องใช้ให้ตรงกันทุกส่วน
+3. ระบุจุดที่ส่วนต่างๆ ขัดแย้งหรือซ้ำซ้อนกัน พร้อมข้อแนะนำ
+ตอบเป็น markdown ไม่เกิน 400 คำ"""
+
+_HEADING = re.compile(r"^(?=#{1,6} )", re.M)
+
+
+class ChunkFailed(Exception):
+    """One of the map calls failed; ``cause`` is the underlying error"""
+
+    def __init__(self, index, total, cause):
+        super().__init__(f"Chunk {index}/{total} failed: {cause}")
+        self.cause = cause
+
+
+def _is_transient(error):
+    """Rate limits and network failures, the errors worth retrying"""
+    if isinstance(error, requests.exceptions.HTTPError):
+        return error.response is not None and error.response.status_code == 429
+    return isinstance(error, (requests.exceptions.ConnectionError, requests.exceptions.Timeout))
+
+
+def needs_chunking(estimate):
+    """Whether a request is too long for the model's context"""
+    return not estimate["fits"]
+
+
+def chunk_budget(model_name, framework_type):
+    """Input tokens available to one chunk for ``model_name``"""
+    instruction = MAP_INSTRUCTION.format(
+        framework_instruction=FRAMEWORK_INSTRUCTIONS[framework_type], index=1, total=1
+    )
+    overhead = count_tokens(instruction, model_name) + MESSAGE_OVERHEAD
+    return max(200, min(CHUNK_TOKENS, model_spec(model_name)["context"] - MAX_TOKENS - overhead))
+
+
+def _units(text, limit, model_name):
+    """Split ``text`` into pieces of at most ``limit`` tokens, coarsest first"""
+    if count_tokens(text, model_name) <= limit:
+        return [text]
+    for pattern in (_HEADING, re.compile(r"\n\s*\n"), re.compile(r"\n")):
+        parts = [part for part in pattern.split(text) if part.strip()]
+        if len(parts) > 1:
+            return [unit for part in parts for unit in _units(part, limit, model_name)]
+    # A single huge line: cut proportionally by characters
+    pieces = -(-count_tokens(text, model_name) // limit)
+    size = -(-len(text) // pieces)
+    return [text[i:i + size] for i in range(0, len(text), size)]
+
+
+def split_into_chunks(text, model_name, limit):
+    """Greedily pack section/paragraph units into chunks of ``limit`` tokens"""
+    chunks, current, used = [], [], 0
+    for unit in _units(text.strip(), limit, model_name):
+        # +2 for the blank line joining units
+        tokens = count_tokens(unit, model_name) + 2
+        if current and used + tokens > limit:
+            chunks.append("\n\n".join(current))
+            current, used = [], 0
+        current.append(unit.strip("\n"))
+        used += tokens
+    if current:
+        chunks.append("\n\n".join(current))
+    return chunks
+
+
+def map_reduce_enhance(prompt, api_key, model_name, framework_type, site_url=None, site_name=None,
+                       temperature=0.7, session_id=None, on_progress=None):
+    """Enhance a long prompt chunk by chunk and stitch the result.
+
+    ``on_progress(done, total)`` is called from the calling thread as map
+    calls finish. Raises ``ChunkFailed`` if any chunk cannot be enhanced.
+    """
+    chunks = split_into_chunks(prompt, model_name, chunk_budget(model_name, framework_type))
+    total = len(chunks)
+    headers = build_headers(api_key, site_url, site_name)
+    enhanced = [None] * total
+
+    def enhance(index):
+        instruction = MAP_INSTRUCTION.format(
+            framework_instruction=FRAMEWORK_INSTRUCTIONS[framework_type], index=index + 1, total=total
+        )
+        key = cache_key(api_key, model_name, f"{framework_type}/map/{instruction}", temperature, chunks[index])
+        cached = cache.get(key)
+        if cached is not None:
+            return cached
+        data = build_payload(chunks[index], model_name, framework_type, temperature, instruction)
+        for attempt in range(MAP_ATTEMPTS):
+            try:
+                content = request_completion(headers, data, model_name, session_id, INTERACTIVE,
+                                             chunk=index + 1, chunks=total, attempt=attempt + 1)
+                break
+            except Exception as e:
+                if attempt == MAP_ATTEMPTS - 1 or not _is_transient(e):
+                    raise
+                time.sleep(2 ** attempt)
+        cache.put(key, content)
+        return content
+
+    pool = ThreadPoolExecutor(max_workers=min(total, MAX_PARALLEL_CHUNKS), thread_name_prefix="map")
+    try:
+        futures = {pool.submit(enhance, index): index for index in range(total)}
+        for done, future in enumerate(as_completed(futures), start=1):
+            index = futures[future]
+            try:
+                enhanced[index] = future.result()
+            except Exception as e:
+                raise ChunkFailed(index + 1, total, e) from e
+            if on_progress is not None:
+                on_progress(done, total)
+    finally:
+        # Don't hold the submit on chunks still running after a failure;
+        # they finish in the background and only fill the cache
+        pool.shutdown(wait=False, cancel_futures=True)
+
+    if total == 1:
+        return enhanced[0]
+
+    outline = "\n\n".join(
+        f"### ส่วนที่ {index + 1}\n{part[:OUTLINE_CHARS]}" for index, part in enumerate(enhanced)
+    )
+    reduce_instruction = REDUCE_INSTRUCTION.format(framework=framework_type, total=total)
+    overview = None
+    if estimate_request(outline, model_name, framework_type)["fits"]:
+        data = build_payload(outline, model_name, framework_type, temperature, reduce_instruction)
+        try:
+            overview = request_completion(headers, data, model_name, session_id, INTERACTIVE, reduce=True)
+        except Exception:
+            # The enhanced parts are still usable without the overview
+            overview = None
+
+    body = "\n\n---\n\n".join(part.strip() for part in enhanced)
+    return f"{overview.strip()}\n\n---\n\n{body}" if overview else body
@@ -0,0 +1,139 @@
+"""Markdown for the documentation tab."""
+
+# Quick start guide
+QUICK_START = """
+        ### ขั้นตอนการใช้งาน
+        
+        1. **ตั้งค่า API Key**
+           - ไปที่ [OpenRouter](https://openrouter.ai/keys) 
+           - สร้าง API Key ฟรี
+           - กรอกใน sidebar
+        
+        2. **เลือก Framework**
+           - **RACE**: สำหรับ AI Prompts ทั่วไป
+           - **BUILD**: สำหรับ Web App Specifications
+        
+        3. **เลือก Template** (ไม่บังคับ)
+           - ช่วยให้เริ่มต้นได้ง่าย
+           - มีตัวอย่างครบทุก field
+        
+        4. **กรอกข้อมูล**
+           - กรอกข้อมูลในแต่ละช่อง
+           - ใช้ preview เพื่อดูผลลัพธ์ก่อน
+        
+        5. **สร้างและปรับปรุง**
+           - กดปุ่ม generate
+           - ได้ผลลัพธ์ที่ปรับปรุงแล้ว
+           - ดาวน์โหลดหรือคัดลอก
+        """
+
+# RACE vs BUILD comparison
+RACE_OVERVIEW = """
+            ### 📝 RACE Framework
+            **เหมาะสำหรับ:**
+            - AI Chatbot prompts
+            - Content creation prompts
+            - Analysis และ research prompts
+            - Creative writing prompts
+            - General AI assistance
+            
+            **จุดเด่น:**
+            - ครอบคลุมทุกด้านของ prompt
+            - ง่ายต่อการเข้าใจ
+            - ใช้ได้กับงานทั่วไป
+            """
+
+BUILD_OVERVIEW = """
+            ### 🏗️ BUILD Framework  
+            **เหมาะสำหรับ:**
+            - Web application planning
+            - Software project specs
+            - System architecture design
+            - Product requirement docs
+            - Technical specifications
+            
+            **จุดเด่น:**
+            - เน้นการพัฒนาซอฟต์แวร์
+            - ครอบคลุม end-to-end development
+            - เหมาะสำหรับทีมพัฒนา
+            """
+
+# Supported models
+MODELS_INFO = """
+        ### โมเดลที่รองรับ
+        
+        **โมเดลฟรี (แนะนำ):**
+        - **Deepseek R1**: โมเดลใหม่ที่มีประสิทธิภาพสูง
+        - **Llama 3.1 8B**: โมเดล open-source ที่เชื่อถือได้
+        - **Qwen 2.5 7B**: โมเดลจาก Alibaba ที่มีความสามารถหลากหลาย
+        
+        **โมเดลเสียเงิน:**
+        - **GPT-3.5/4**: จาก OpenAI
+        - **Claude 3.5**: จาก Anthropic  
+        - **Mistral 7B**: จาก Mistral AI
+        
+        **โมเดล Offline (ถ้าติดตั้งไว้):**
+        - **Local - Qwen 2.5 0.5B**: รันบน CPU ของเซิร์ฟเวอร์ ไม่ต้องใช้อินเทอร์เน็ตหรือ API Key
+          (ต้องติดตั้ง `llama-cpp-python` และตั้งค่า `PROMPTGEN_LOCAL_MODEL` เป็น path ของไฟล์ GGUF)
+        
+        ### การตั้งค่า Temperature
+        - **0.0-0.3**: ผลลัพธ์ที่แน่นอน เหมาะสำหรับงานเทคนิค
+        - **0.4-0.7**: สมดุลระหว่างความแน่นอนและความคิดสร้างสรรค์
+        - **0.8-1.0**: ผลลัพธ์ที่สร้างสรรค์ เหมาะสำหรับงานเขียน
+        """
+
+# Troubleshooting
+TROUBLESHOOTING = """
+        ### ปัญหาที่พบบ่อย
+        
+        **❌ Error 401 - No auth credentials**
+        - ตรวจสอบว่าได้กรอก API Key แล้ว
+        - ตรวจสอบ API Key ให้ถูกต้อง
+        - ลองสร้าง API Key ใหม่
+        
+        **❌ Error 402 - Payment required**  
+        - เครดิตหมด (สำหรับโมเดลเสียเงิน)
+        - เปลี่ยนเป็นโมเดลฟรี
+        - เติมเครดิตใน OpenRouter
+        
+        **❌ Error 429 - Rate limit**
+        - ใช้งานเกินขีดจำกัด
+        - รอสักครู่แล้วลองใหม่
+        - ใช้โมเดลอื่น
+        
+        **❌ Connection timeout**
+        - ตรวจสอบการเชื่อมต่ออินเทอร์เน็ต
+        - ลองใหม่อีกครั้ง
+        - เปลี่ยนโมเดล AI
+        
+        ### วิธีแก้เพิ่มเติม
+        - รีเฟรชหน้าเว็บ
+        - ล้าง cache ของเบราว์เซอร์
+        - ลองใช้เบราว์เซอร์อื่น
+        """
+
+# Tips and best practices
+TIPS = """
+        ### เคล็ดลับการเขียน Prompt ที่ดี
+        
+        **สำหรับ RACE Framework:**
+        - **Role**: ระบุความเชี่ยวชาญเฉพาะ
+        - **Action**: ใช้กริยาที่ชัดเจน
+        - **Context**: ให้ข้อมูลที่เกี่ยวข้อง
+        - **Explanation**: อธิบายรายละเอียดที่สำคัญ
+        - **Example**: ให้ตัวอย่างที่เป็นรูปธรรม
+        - **Tips**: เพิ่มข้อควรระวังหรือคำแนะนำ
+        
+        **สำหรับ BUILD Framework:**
+        - **Background**: อธิบายปัญหาที่แก้ไข
+        - **User**: ระบุ personas และ use cases
+        - **Interface**: อธิบาย UX/UI ที่ต้องการ
+        - **Logic**: รายละเอียดฟีเจอร์หลัก
+        - **Development**: ระบุ tech stack ที่เหมาะสม
+        
+        ### การปรับแต่งผลลัพธ์
+        - ใช้ temperature ต่ำสำหรับงานเทคนิค
+        - ใช้ temperature สูงสำหรับงานสร้างสรรค์
+        - ทดลองโมเดลต่างๆ เพื่อผลลัพธ์ที่หลากหลาย
+        - เก็บ prompt ที่ดีไว้เป็น template
+        """
@@ -0,0 +1,139 @@
+"""Per-model latency/failure tracking and automatic model selection.
+
+Every upstream call records its latency, outcome and output length into a
+fixed-size ring buffer per model. ``ModelRouter.choose`` runs a UCB1 bandit
+over those windows, where a call earns full reward only if it succeeded
+within the latency SLO, so the "auto" option drifts toward whichever free
+model is currently fast and reliable while still probing the others.
+
+The router is process-wide: all Streamlit sessions feed and read the same
+statistics.
+"""
+
+import math
+import threading
+from array import array
+
+# A call slower than this counts as a partial success
+LATENCY_SLO_SECONDS = 20.0
+
+# Outputs shorter than this (in tokens) are treated as degraded answers
+MIN_USEFUL_OUTPUT = 50
+
+WINDOW = 128
+
+
+class RingBuffer:
+    """Last ``size`` calls for one model, stored in flat typed arrays"""
+
+    def __init__(self, size=WINDOW):
+        self.size = size
+        self.latency = array("f", [0.0] * size)
+        self.ok = array("b", [0] * size)
+        self.output = array("I", [0] * size)
+        self.pos = 0
+        self.count = 0
+
+    def append(self, latency, ok, output_tokens):
+        self.latency[self.pos] = latency
+        self.ok[self.pos] = 1 if ok else 0
+        self.output[self.pos] = output_tokens
+        self.pos = (self.pos + 1) % self.size
+        self.count = min(self.count + 1, self.size)
+
+    def rows(self):
+        return [(self.latency[i], self.ok[i], self.output[i]) for i in range(self.count)]
+
+
+def _reward(latency, ok, output_tokens, slo):
+    if not ok:
+        return 0.0
+    reward = 1.0 if latency <= slo else slo / latency
+    if output_tokens < MIN_USEFUL_OUTPUT:
+        reward *= 0.5
+    return reward
+
+
+def _percentile(values, q):
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+class ModelRouter:
+    """UCB1 model picker fed by observed latency, failures and output length"""
+
+    def __init__(self, slo=LATENCY_SLO_SECONDS, window=WINDOW, exploration=1.0):
+        self.slo = slo
+        self.window = window
+        self.exploration = exploration
+        self._buffers = {}
+        self._lock = threading.Lock()
+
+    def record(self, model_name, latency, ok, output_tokens=0):
+        """Add one finished (or failed) upstream call"""
+        with self._lock:
+            buffer = self._buffers.get(model_name)
+            if buffer is None:
+                buffer = self._buffers[model_name] = RingBuffer(self.window)
+            buffer.append(latency, ok, output_tokens)
+
+    def choose(self, candidates):
+        """Pick a model from ``candidates``; untried models are tried first"""
+        with self._lock:
+            snapshot = {name: self._buffers[name].rows() for name in candidates if name in self._buffers}
+
+        untried = [name for name in candidates if not snapshot.get(name)]
+        if untried:
+            return untried[0]
+
+        total = sum(len(rows) for rows in snapshot.values())
+        best, best_score = candidates[0], -1.0
+        for name in candidates:
+            rows = snapshot[name]
+            mean = sum(_reward(l, ok, out, self.slo) for l, ok, out in rows) / len(rows)
+            score = mean + self.exploration * math.sqrt(2 * math.log(total) / len(rows))
+            if score > best_score:
+                best, best_score = name, score
+        return best
+
+    def fastest(self, candidates):
+        """Candidate with the lowest median successful latency.
+
+        Models failing more often than not are skipped; without any usable
+        history this falls back to ``choose``.
+        """
+        with self._lock:
+            snapshot = {name: self._buffers[name].rows() for name in candidates if name in self._buffers}
+
+        best, best_latency = None, None
+        for name, rows in snapshot.items():
+            latencies = [l for l, ok, _ in rows if ok]
+            if not rows or len(latencies) * 2 < len(rows):
+                continue
+            latency = _percentile(latencies, 0.5)
+            if best_latency is None or latency < best_latency:
+                best, best_latency = name, latency
+        return best if best is not None else self.choose(candidates)
+
+    def summary(self):
+        """One row of aggregate stats per model seen so far"""
+        with self._lock:
+            snapshot = {name: buffer.rows() for name, buffer in self._buffers.items()}
+
+        table = []
+        for name, rows in sorted(snapshot.items()):
+            latencies = [l for l, ok, _ in rows if ok]
+            outputs = [out for _, ok, out in rows if ok]
+            table.append({
+                "model": name,
+                "calls": len(rows),
+                "failure_rate": round(1 - len(latencies) / len(rows), 3),
+                "p50_s": round(_percentile(latencies, 0.5), 2) if latencies else None,
+                "p95_s": round(_percentile(latencies, 0.95), 2) if latencies else None,
+                "slo_hit_rate": round(sum(1 for l in latencies if l <= self.slo) / len(rows), 3),
+                "avg_output_tokens": round(sum(outputs) / len(outputs)) if outputs else None,
+            })
+        return table
+
+
+router = ModelRouter()
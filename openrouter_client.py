@@ -0,0 +1,243 @@
+"""OpenRouter chat-completions client.
+
+Imported on the first enhancement rather than at page load, so the HTTP
+stack stays off the cold-start path.
+"""
+
+import logging
+import time
+
+import requests
+import streamlit as st
+
+from assets import AI_MODELS, FRAMEWORK_INSTRUCTIONS, MAX_TOKENS
+from backends import backend_for, scheduler_for
+from model_router import router
+from request_log import log_event, new_correlation_id
+from response_cache import cache, cache_key, prompt_key
+from scheduler import BATCH, INTERACTIVE, QueueFull
+from token_counter import count_tokens
+
+OPENROUTER_URL = "https://openrouter.ai/api/v1/chat/completions"
+
+# How long a submit waits for a matching speculative enhancement already running upstream
+PREFETCH_WAIT_SECONDS = 60
+
+def build_headers(api_key, site_url=None, site_name=None):
+    return {
+        "Authorization": f"Bearer {api_key}",
+        "Content-Type": "application/json",
+        "HTTP-Referer": site_url or "https://streamlit.io",
+        "X-Title": site_name or "Multi-Framework Prompt Generator"
+    }
+
+def build_payload(prompt, model_name, framework_type, temperature, instruction=None, max_tokens=MAX_TOKENS):
+    return {
+        "model": AI_MODELS[model_name],
+        "messages": [{
+            "role": "user", 
+            "content": f"{instruction or FRAMEWORK_INSTRUCTIONS[framework_type]}:\n\n{prompt}"
+        }],
+        "temperature": temperature,
+        "max_tokens": max_tokens,
+        "top_p": 0.9
+    }
+
+def request_completion(headers, data, model_name, session_id, priority=BATCH, on_admit=None, **log_fields):
+    """Single upstream attempt with no UI, for background threads.
+
+    Goes through the scheduler, router stats and lifecycle log like
+    ``call_openrouter_api``, but raises on any failure instead of retrying
+    or rendering messages. ``on_admit()`` is called once a slot is granted;
+    if it returns False the call is abandoned and None is returned.
+    """
+    cid = new_correlation_id()
+    log_fields["model"] = data["model"]
+    log_event("queued", cid, session_id, priority=priority, **log_fields)
+    try:
+        with scheduler_for(data["model"]).slot(session_id, priority):
+            if on_admit is not None and not on_admit():
+                log_event("cancelled", cid, session_id, **log_fields)
+                return None
+            log_event("connect", cid, session_id, **log_fields)
+            started = time.perf_counter()
+            try:
+                response = backend_for(data["model"]).post(OPENROUTER_URL, headers=headers, json=data, timeout=60)
+                log_event("first_byte", cid, session_id, status=response.status_code,
+                          ttfb_ms=round(response.elapsed.total_seconds() * 1000), **log_fields)
+                response.raise_for_status()
+                content = response.json()['choices'][0]['message']['content']
+            except requests.exceptions.HTTPError as e:
+                # Auth and credit problems say nothing about the model itself
+                if e.response.status_code not in (401, 402):
+                    router.record(model_name, time.perf_counter() - started, False)
+                raise
+            except Exception:
+                router.record(model_name, time.perf_counter() - started, False)
+                raise
+    except Exception as e:
+        log_event("error", cid, session_id, logging.WARNING, exc_info=not isinstance(e, QueueFull),
+                  kind=type(e).__name__, **log_fields)
+        raise
+
+    output_tokens = count_tokens(content, model_name)
+    router.record(model_name, time.perf_counter() - started, True, output_tokens)
+    log_event("complete", cid, session_id, source="upstream", output_tokens=output_tokens,
+              latency_ms=round((time.perf_counter() - started) * 1000), **log_fields)
+    return content
+
+def call_openrouter_api(prompt, api_key, model_name, framework_type, site_url=None, site_name=None, temperature=0.7,
+                        session_id=None, priority=INTERACTIVE, max_tokens=MAX_TOKENS):
+    """Enhanced API call function with better error handling and retry logic"""
+    # Shortened answers must not be served to later full-length requests
+    variant = framework_type if max_tokens == MAX_TOKENS else f"{framework_type}/max{max_tokens}"
+    key = cache_key(api_key, model_name, variant, temperature, prompt)
+    # Join a speculative enhancement only once it runs upstream. One still
+    # queued as batch work would be served after every interactive call, so
+    # it is cancelled and this submit goes upstream itself
+    if not cache.cancel(key) and cache.is_started(key):
+        with st.spinner("⚡ กำลังรอผลลัพธ์ที่เตรียมไว้ล่วงหน้า..."):
+            cached = cache.take(key, wait=PREFETCH_WAIT_SECONDS)
+    else:
+        cached = cache.take(key)
+
+    cid = new_correlation_id()
+
+    def log(phase, level=logging.INFO, exc_info=False, **fields):
+        log_event(phase, cid, session_id, level, exc_info,
+                  model=AI_MODELS[model_name], framework=framework_type, **fields)
+
+    if cached is not None:
+        log("complete", source="cache")
+        return cached
+
+    url = OPENROUTER_URL
+    headers = build_headers(api_key, site_url, site_name)
+    data = build_payload(prompt, model_name, framework_type, temperature, max_tokens=max_tokens)
+
+    scheduler = scheduler_for(data["model"])
+    queue_notice = st.empty()
+
+    def show_queue(position, eta):
+        queue_notice.info(f"⏳ อยู่ในคิวลำดับที่ {position} · รอประมาณ {eta:.0f} วินาที")
+
+    max_retries = 3
+    for attempt in range(max_retries):
+        started = time.perf_counter()
+        try:
+            log("queued", attempt=attempt + 1, priority=priority, queue_depth=scheduler.stats()["queued"])
+            with scheduler.slot(session_id, priority, on_wait=show_queue):
+                queue_notice.empty()
+                log("connect", attempt=attempt + 1, queue_wait_ms=round((time.perf_counter() - started) * 1000))
+                started = time.perf_counter()
+                with st.spinner(f"🔮 AI กำลังปรับปรุง {framework_type} Specification ของคุณ... (ครั้งที่ {attempt + 1})"):
+                    response = backend_for(data["model"]).post(url, headers=headers, json=data, timeout=60)
+                    log("first_byte", attempt=attempt + 1, status=response.status_code,
+                        ttfb_ms=round(response.elapsed.total_seconds() * 1000))
+                    response.raise_for_status()
+                    
+                    result = response.json()
+                    content = result['choices'][0]['message']['content']
+                    output_tokens = count_tokens(content, model_name)
+                    router.record(model_name, time.perf_counter() - started, True, output_tokens)
+                    cache.put(key, content, prompt_key(api_key, framework_type, prompt), model_name)
+                    log("complete", attempt=attempt + 1, source="upstream", output_tokens=output_tokens,
+                        latency_ms=round((time.perf_counter() - started) * 1000))
+                    return content
+                
+        except QueueFull as e:
+            log("error", logging.WARNING, kind="queue_full", retry_after_s=round(e.retry_after))
+            queue_notice.empty()
+            st.error(f"🚦 มีผู้ใช้งานจำนวนมาก คิวเต็มแล้ว กรุณาลองใหม่ในอีกประมาณ {e.retry_after:.0f} วินาที")
+            return None
+                
+        except requests.exceptions.HTTPError as e:
+            # Error responses are falsy, so test for None; bodies may not be JSON
+            try:
+                error_info = e.response.json().get('error', {}) if e.response is not None else {}
+            except ValueError:
+                error_info = {}
+            error_code = error_info.get('code', 'unknown')
+            error_message = error_info.get('message', 'Unknown error')
+            status = e.response.status_code
+            
+            # A 429 with retries left is logged as a retry below
+            if status != 429 or attempt == max_retries - 1:
+                log("error", logging.ERROR, kind="http", status=status, code=error_code, message=error_message,
+                    attempt=attempt + 1)
+            
+            if e.response.status_code == 401:
+                st.error(f"🔑 ข้อผิดพลาดการยืนยันตัวตน: {error_message}")
+                st.markdown("""
+                💡 **วิธีแก้ปัญหา:**
+                1. ตรวจสอบว่าได้กรอก API Key แล้ว
+                2. ตรวจสอบความถูกต้องของ API Key ใน [OpenRouter Dashboard](https://openrouter.ai/account)
+                3. ตรวจสอบว่า API Key ยังไม่หมดอายุ
+                """)
+                return None
+                
+            elif e.response.status_code == 402:
+                st.error(f"💳 ข้อผิดพลาดการชำระเงิน: {error_message}")
+                st.markdown("""
+                💡 **วิธีแก้ปัญหา:**
+                1. ตรวจสอบเครดิตคงเหลือใน [OpenRouter Dashboard](https://openrouter.ai/account)
+                2. ตรวจสอบราคาโมเดลใน [OpenRouter Pricing](https://openrouter.ai/pricing)
+                3. ลองเปลี่ยนเป็นโมเดลฟรี (มี "Free" ในชื่อ)
+                """)
+                return None
+                
+            elif e.response.status_code == 429:
+                router.record(model_name, time.perf_counter() - started, False)
+                if attempt < max_retries - 1:
+                    wait_time = 2 ** attempt
+                    log("retry", logging.WARNING, attempt=attempt + 1, reason="rate_limited", status=status,
+                        wait_s=wait_time)
+                    st.warning(f"⏳ ถูกจำกัดอัตรา รอ {wait_time} วินาที...")
+                    time.sleep(wait_time)
+                    continue
+                else:
+                    st.error("🚫 ถูกจำกัดอัตราการใช้งาน กรุณาลองใหม่ภายหลัง")
+                    return None
+            else:
+                router.record(model_name, time.perf_counter() - started, False)
+                st.error(f"⚠️ ข้อผิดพลาด {e.response.status_code} ({error_code}): {error_message}")
+                return None
+                
+        except requests.exceptions.ConnectionError as e:
+            router.record(model_name, time.perf_counter() - started, False)
+            if attempt < max_retries - 1:
+                log("retry", logging.WARNING, attempt=attempt + 1, reason="connection", detail=str(e), wait_s=2)
+                st.warning(f"🔄 ปัญหาการเชื่อมต่อ กำลังลองใหม่... ({attempt + 1}/{max_retries})")
+                time.sleep(2)
+                continue
+            else:
+                log("error", logging.ERROR, kind="connection", detail=str(e), attempt=attempt + 1)
+                st.error("🚨 ไม่สามารถเชื่อมต่อกับเซิร์ฟเวอร์ OpenRouter ได้ โปรดตรวจสอบการเชื่อมต่ออินเทอร์เน็ตของคุณ")
+                return None
+
+        except requests.exceptions.Timeout:
+            router.record(model_name, time.perf_counter() - started, False)
+            if attempt < max_retries - 1:
+                log("retry", logging.WARNING, attempt=attempt + 1, reason="timeout", wait_s=0)
+                st.warning(f"⏰ หมดเวลา กำลังลองใหม่... ({attempt + 1}/{max_retries})")
+                continue
+            else:
+                log("error", logging.ERROR, kind="timeout", attempt=attempt + 1)
+                st.error("🚨 การเชื่อมต่อ API เกินเวลา โปรดลองใหม่อีกครั้ง")
+                return None
+
+        except Exception as e:
+            router.record(model_name, time.perf_counter() - started, False)
+            if attempt < max_retries - 1:
+                log("retry", logging.WARNING, exc_info=True, attempt=attempt + 1, reason="unexpected",
+                    error_type=type(e).__name__, wait_s=1)
+                st.warning(f"🔄 เกิดข้อผิดพลาด กำลังลองใหม่... ({attempt + 1}/{max_retries})")
+                time.sleep(1)
+                continue
+            else:
+                log("error", logging.ERROR, exc_info=True, kind="unexpected", error_type=type(e).__name__,
+                    attempt=attempt + 1)
+                st.error(f"🚨 เกิดข้อผิดพลาดที่ไม่คาดคิด: {str(e)}")
+                return None
+
+    return None
@@ -0,0 +1,103 @@
+"""Overload detection and stepwise graceful degradation.
+
+``OverloadController`` turns upstream calls in flight, upstream and local
+model queue depth, smoothed queue wait and thread count into a pressure
+score between 0 and 1. It maps that score
+to a degradation level; each level keeps the measures of the levels below:
+
+0. ``NORMAL``
+1. ``CACHE_FIRST`` - answer from the response cache whenever any result for
+   the same prompt exists (any model or temperature); no speculation, no
+   map-reduce fan-out
+2. ``FASTEST_FREE`` - route new requests to the fastest free model
+3. ``SHORT_OUTPUT`` - cap completions at ``SHORT_MAX_TOKENS``
+4. ``REJECT`` - refuse new requests with a retry-after hint
+
+A level drops only once pressure is ``HYSTERESIS`` below its threshold, so
+the level doesn't flap around a boundary.
+"""
+
+import logging
+import threading
+
+from request_log import log_event
+from scheduler import local_scheduler as local_model_scheduler
+from scheduler import scheduler as upstream_scheduler
+
+NORMAL, CACHE_FIRST, FASTEST_FREE, SHORT_OUTPUT, REJECT = range(5)
+
+LEVEL_NAMES = {
+    NORMAL: "ปกติ",
+    CACHE_FIRST: "ใช้ผลลัพธ์ที่มีอยู่ก่อน",
+    FASTEST_FREE: "ใช้โมเดลฟรีที่เร็วที่สุด",
+    SHORT_OUTPUT: "จำกัดความยาวคำตอบ",
+    REJECT: "ปฏิเสธคำขอใหม่ชั่วคราว",
+}
+
+# Pressure at which each level starts
+THRESHOLDS = {CACHE_FIRST: 0.25, FASTEST_FREE: 0.5, SHORT_OUTPUT: 0.75, REJECT: 0.95}
+HYSTERESIS = 0.1
+
+# Smoothed queue wait that counts as full pressure, in seconds
+QUEUE_WAIT_LIMIT = 30.0
+
+# Live threads (Streamlit sessions + worker pools) that count as full pressure
+THREAD_LIMIT = 200
+
+# Pressure when every upstream slot is busy. Full slots alone mean new calls
+# will queue (worth degrading for), not that the queue is overflowing
+RUNNING_WEIGHT = 0.5
+
+SHORT_MAX_TOKENS = 1500
+
+
+class OverloadController:
+    """Tracks load signals and the current degradation level"""
+
+    def __init__(self, scheduler=upstream_scheduler, local_scheduler=local_model_scheduler):
+        self.scheduler = scheduler
+        self.local_scheduler = local_scheduler
+        self._level = NORMAL
+        self._pressure = 0.0
+        self._lock = threading.Lock()
+
+    def pressure(self):
+        """Worst of slot use, queue fill, queue wait and thread saturation, capped at 1"""
+        stats = self.scheduler.stats()
+        local = self.local_scheduler.stats()
+        return min(1.0, max(
+            RUNNING_WEIGHT * stats["running"] / stats["max_concurrent"],
+            stats["queued"] / stats["max_queue"],
+            local["queued"] / local["max_queue"],
+            stats["queue_wait"] / QUEUE_WAIT_LIMIT,
+            threading.active_count() / THREAD_LIMIT,
+        ))
+
+    def level(self):
+        """Re-evaluate and return the current degradation level"""
+        pressure = self.pressure()
+        with self._lock:
+            previous = self._level
+            level = NORMAL
+            for candidate, threshold in THRESHOLDS.items():
+                # Already-active levels are kept until pressure clearly drops
+                margin = HYSTERESIS if candidate <= previous else 0.0
+                if pressure >= threshold - margin:
+                    level = candidate
+            self._level, self._pressure = level, pressure
+        if level != previous:
+            log_event("degradation", None, None, logging.WARNING if level > previous else logging.INFO,
+                      degradation=level, previous=previous, pressure=round(pressure, 3))
+        return level
+
+    def retry_after(self):
+        """Seconds a rejected user should wait before trying again"""
+        stats = self.scheduler.stats()
+        return max(10.0, stats["queue_wait"] + stats["service_time"])
+
+    def metrics(self):
+        with self._lock:
+            return {"level": self._level, "name": LEVEL_NAMES[self._level], "pressure": round(self._pressure, 3)}
+
+
+controller = OverloadController()
@@ -0,0 +1,82 @@
+"""Speculative enhancement of selected templates.
+
+Most users submit a template unchanged, so when speculation is enabled the
+enhancement starts as soon as a template is picked. It runs in a small
+background pool as batch-priority work, so it never delays anyone's form
+submit, and the result lands in the response cache. A submit with untouched
+fields then takes it from the cache (each result is served once), or waits
+on the request if it is already running upstream. A speculation still queued when the submit
+arrives is cancelled, since batch work would only be served after it.
+
+Speculation is capped per session by call count. It only uses free models
+unless paid models are explicitly allowed, and then only within a small
+spend limit based on the worst-case cost estimate.
+"""
+
+from concurrent.futures import ThreadPoolExecutor
+
+from openrouter_client import build_headers, build_payload, request_completion
+from response_cache import cache, cache_key, prompt_key
+from scheduler import BATCH
+from token_counter import estimate_request, is_free_model
+
+SPECULATION_CALLS_PER_SESSION = 10
+
+# USD per session; only reachable when paid models are allowed
+SPECULATION_SPEND_LIMIT = 0.05
+
+_pool = ThreadPoolExecutor(max_workers=2, thread_name_prefix="prefetch")
+
+
+def new_budget():
+    """Per-session speculation budget, kept in ``st.session_state``"""
+    return {"calls": 0, "spent": 0.0, "keys": set()}
+
+
+def speculate(prompt, api_key, model_name, framework_type, site_url, site_name, temperature,
+              session_id, budget, allow_paid=False):
+    """Start a background enhancement of ``prompt`` if the budget allows it.
+
+    Each prompt/model/temperature combination is tried at most once per
+    session. Returns True when a request was started.
+    """
+    key = cache_key(api_key, model_name, framework_type, temperature, prompt)
+    if key in budget["keys"] or budget["calls"] >= SPECULATION_CALLS_PER_SESSION:
+        return False
+
+    estimate = estimate_request(prompt, model_name, framework_type)
+    if not estimate["fits"]:
+        return False
+    if not is_free_model(model_name):
+        # A paid model without a known price can't be kept within the limit
+        if not allow_paid or not estimate["cost"] or budget["spent"] + estimate["cost"] > SPECULATION_SPEND_LIMIT:
+            return False
+    reservation = cache.reserve(key)
+    if reservation is None:
+        return False
+
+    budget["keys"].add(key)
+    budget["calls"] += 1
+    budget["spent"] += estimate["cost"]
+    _pool.submit(
+        _enhance, key, reservation, prompt_key(api_key, framework_type, prompt), session_id, model_name,
+        build_headers(api_key, site_url, site_name),
+        build_payload(prompt, model_name, framework_type, temperature),
+    )
+    return True
+
+
+def _enhance(key, reservation, alias, session_id, model_name, headers, data):
+    # Cancelled by a submit before a worker picked it up
+    if not cache.is_pending(key, reservation):
+        return
+    # Single attempt: a failed speculation just leaves the cache empty
+    try:
+        content = request_completion(headers, data, model_name, session_id, BATCH,
+                                     on_admit=lambda: cache.start(key, reservation), speculative=True)
+        if content is not None:
+            cache.put(key, content, alias, model_name, speculative=True)
+    except Exception:
+        pass
+    finally:
+        cache.release(key, reservation)
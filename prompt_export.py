@@ -0,0 +1,148 @@
+"""Bulk export of enhancement history as txt / md / JSON / JSONL bundles.
+
+Zip archives are produced by a generator that emits each compressed entry
+as soon as it is written, so memory holds one entry at a time (plus zip's
+small per-entry central-directory record) rather than the whole archive.
+Finished archives are spooled to a temp directory under their content hash;
+re-exporting an unchanged selection reuses the file.
+"""
+
+import hashlib
+import io
+import json
+import os
+import tempfile
+import zipfile
+from datetime import datetime
+
+FORMATS = ("txt", "md", "json", "jsonl")
+
+# Session history is capped so long-lived sessions don't grow without bound
+HISTORY_LIMIT = 1000
+
+CACHE_DIR = os.path.join(tempfile.gettempdir(), "promptgen-exports")
+CACHE_KEEP = 32
+
+
+def history_item(framework_type, model_name, temperature, prompt, result):
+    """History entry for one finished enhancement; timestamped once, here"""
+    created = datetime.now()
+    return {
+        "framework": framework_type,
+        "model": model_name,
+        "temperature": temperature,
+        "created_at": created.isoformat(timespec="seconds"),
+        "stamp": created.strftime('%Y%m%d_%H%M%S'),
+        "prompt": prompt,
+        "result": result,
+    }
+
+
+def append_history(history, item):
+    history.append(item)
+    del history[:-HISTORY_LIMIT]
+
+
+def render_item(item, fmt):
+    """One history item in ``fmt``; ``jsonl`` yields a single line"""
+    if fmt == "txt":
+        return item["result"]
+    if fmt == "md":
+        return (
+            f"# {item['framework']} · {item['model']} · {item['created_at']}\n\n"
+            f"## ต้นฉบับ\n\n{item['prompt'].strip()}\n\n"
+            f"## ผลลัพธ์\n\n{item['result'].strip()}\n"
+        )
+    if fmt == "json":
+        return json.dumps(item, ensure_ascii=False, indent=2)
+    if fmt == "jsonl":
+        return json.dumps(item, ensure_ascii=False) + "\n"
+    raise ValueError(f"Unknown export format: {fmt}")
+
+
+def item_filename(item, index, fmt):
+    return f"{item['framework'].lower()}_{item['stamp']}_{index:04d}.{fmt}"
+
+
+class _Sink(io.RawIOBase):
+    """Write-only, non-seekable buffer that hands its bytes back on ``drain``"""
+
+    def __init__(self):
+        self._chunks = []
+
+    def writable(self):
+        return True
+
+    def write(self, data):
+        self._chunks.append(bytes(data))
+        return len(data)
+
+    def drain(self):
+        data = b"".join(self._chunks)
+        self._chunks.clear()
+        return data
+
+
+def iter_zip(items, formats):
+    """Yield a zip archive of ``items`` chunk by chunk.
+
+    Every selected format except ``jsonl`` gets one file per item; ``jsonl``
+    becomes a single ``history.jsonl`` holding all items.
+    """
+    sink = _Sink()
+    with zipfile.ZipFile(sink, mode="w", compression=zipfile.ZIP_DEFLATED) as archive:
+        for index, item in enumerate(items, start=1):
+            for fmt in formats:
+                if fmt != "jsonl":
+                    archive.writestr(item_filename(item, index, fmt), render_item(item, fmt))
+            yield sink.drain()
+        if "jsonl" in formats:
+            with archive.open("history.jsonl", mode="w", force_zip64=True) as entry:
+                for item in items:
+                    entry.write(render_item(item, "jsonl").encode("utf-8"))
+                    chunk = sink.drain()
+                    if chunk:
+                        yield chunk
+    yield sink.drain()
+
+
+def bundle_digest(items, formats):
+    """Content hash identifying an export of ``items`` in ``formats``"""
+    digest = hashlib.sha256(",".join(sorted(formats)).encode("utf-8"))
+    for item in items:
+        digest.update(render_item(item, "jsonl").encode("utf-8"))
+    return digest.hexdigest()[:24]
+
+
+def cached_bundle(items, formats, cache_dir=CACHE_DIR):
+    """Path to the zip for ``items``, building it only if not cached yet"""
+    os.makedirs(cache_dir, exist_ok=True)
+    path = os.path.join(cache_dir, f"{bundle_digest(items, formats)}.zip")
+    if os.path.exists(path):
+        os.utime(path)
+        return path
+
+    fd, tmp_path = tempfile.mkstemp(dir=cache_dir, suffix=".part")
+    try:
+        with os.fdopen(fd, "wb") as fh:
+            for chunk in iter_zip(items, formats):
+                fh.write(chunk)
+        os.replace(tmp_path, path)
+    except BaseException:
+        os.remove(tmp_path)
+        raise
+    _prune(cache_dir)
+    return path
+
+
+def _prune(cache_dir, keep=CACHE_KEEP):
+    bundles = sorted(
+        (entry for entry in os.scandir(cache_dir) if entry.name.endswith(".zip")),
+        key=lambda entry: entry.stat().st_mtime,
+        reverse=True,
+    )
+    for entry in bundles[keep:]:
+        try:
+            os.remove(entry.path)
+        except OSError:
+            pass
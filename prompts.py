@@ -0,0 +1,42 @@
+"""Assemble the raw RACE / BUILD prompts from form fields."""
+
+
+def build_race_prompt(race_data):
+    """Markdown RACE prompt from the six RACE fields"""
+    return f"""### 🎭 Role
+{race_data['role']}
+
+### 🎯 Action
+{race_data['action']}
+
+### 📖 Context
+{race_data['context']}
+
+### 📋 Explanation
+{race_data['explanation']}
+
+### 💡 Example Output
+{race_data['example_output']}
+
+### 🔧 Tips
+{race_data['tips']}
+"""
+
+
+def build_build_spec(build_data):
+    """Markdown BUILD specification from the five BUILD fields"""
+    return f"""## 🎯 Background
+{build_data['background']}
+
+## 👥 User
+{build_data['user']}
+
+## 🎨 Interface
+{build_data['interface']}
+
+## 🧠 Logic
+{build_data['logic']}
+
+## 🛠️ Development Stack
+{build_data['development']}
+"""
@@ -0,0 +1,124 @@
+"""Structured JSON logging of the upstream request lifecycle.
+
+One event per phase (``queued``, ``connect``, ``first_byte``, ``complete``,
+``retry``, ``error``, ``cancelled``), each carrying the request's
+correlation id and the Streamlit session id. Callers only put the record
+on a bounded in-memory queue; a background listener thread serialises it
+and writes it to a size-rotated JSON Lines file. When the queue is full,
+events are dropped and counted (shown in the sidebar stats), so logging
+never blocks a request.
+
+``PROMPTGEN_LOG_PATH`` sets the file (default ``logs/requests.jsonl``). If
+its directory can't be created or written, events go to the temp directory
+instead, or are discarded.
+"""
+
+import atexit
+import json
+import logging
+import logging.handlers
+import os
+import queue
+import tempfile
+import time
+import uuid
+
+LOG_PATH = os.environ.get(
+    "PROMPTGEN_LOG_PATH",
+    os.path.join(os.path.dirname(os.path.abspath(__file__)), "logs", "requests.jsonl"),
+)
+MAX_BYTES = 5 * 1024 * 1024
+BACKUP_COUNT = 5
+QUEUE_SIZE = 10000
+
+logger = logging.getLogger("promptgen.requests")
+
+
+class JsonFormatter(logging.Formatter):
+    """Render a lifecycle record as a single JSON line"""
+
+    def format(self, record):
+        event = {
+            "ts": round(record.created, 3),
+            "level": record.levelname.lower(),
+            "phase": record.getMessage(),
+        }
+        event.update(getattr(record, "event", {}))
+        if record.exc_text:
+            event["traceback"] = record.exc_text
+        return json.dumps(event, ensure_ascii=False, default=str)
+
+
+class _DroppingQueueHandler(logging.handlers.QueueHandler):
+    """QueueHandler that drops instead of blocking or raising when full"""
+
+    dropped = 0
+
+    def prepare(self, record):
+        # Only the traceback is rendered on the caller's thread; JSON
+        # serialisation happens in the listener
+        if record.exc_info:
+            record.exc_text = logging.Formatter().formatException(record.exc_info)
+            record.exc_info = None
+        return record
+
+    def enqueue(self, record):
+        try:
+            self.queue.put_nowait(record)
+        except queue.Full:
+            type(self).dropped += 1
+
+
+def _file_handler(path=None):
+    """Rotating handler at ``path``, else in the temp dir, else a NullHandler.
+
+    Logging must never stop the app from starting, e.g. from a read-only
+    source tree. The file is opened on the first event, not at import.
+    """
+    for candidate in (path or LOG_PATH, os.path.join(tempfile.gettempdir(), "promptgen", "requests.jsonl")):
+        directory = os.path.dirname(os.path.abspath(candidate))
+        try:
+            os.makedirs(directory, exist_ok=True)
+        except OSError:
+            continue
+        if os.access(directory, os.W_OK):
+            return logging.handlers.RotatingFileHandler(
+                candidate, maxBytes=MAX_BYTES, backupCount=BACKUP_COUNT, encoding="utf-8", delay=True
+            )
+    return logging.NullHandler()
+
+
+def _configure():
+    if logger.handlers:
+        return None
+    file_handler = _file_handler()
+    file_handler.setFormatter(JsonFormatter())
+    records = queue.Queue(maxsize=QUEUE_SIZE)
+    logger.addHandler(_DroppingQueueHandler(records))
+    logger.setLevel(logging.INFO)
+    logger.propagate = False
+    listener = logging.handlers.QueueListener(records, file_handler, respect_handler_level=False)
+    listener.start()
+    # Flush whatever is still queued when the process exits
+    atexit.register(listener.stop)
+    return listener
+
+
+_listener = _configure()
+
+
+def new_correlation_id():
+    return uuid.uuid4().hex[:16]
+
+
+def log_event(phase, correlation_id, session_id, level=logging.INFO, exc_info=False, **fields):
+    """Queue one lifecycle event; ``fields`` become top-level JSON keys"""
+    fields["correlation_id"] = correlation_id
+    fields["session_id"] = session_id
+    fields["mono_ms"] = round(time.monotonic() * 1000)
+    logger.log(level, phase, exc_info=exc_info, extra={"event": fields})
+
+
+def dropped_events():
+    """Events dropped so far because the queue was full"""
+    return _DroppingQueueHandler.dropped
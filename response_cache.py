@@ -0,0 +1,168 @@
+"""Process-wide cache of enhancement results.
+
+Keys cover everything that shapes the output (model, framework,
+temperature, prompt) plus a hash of the API key, so one user's credit is
+never used to answer another user's request. A key can be *reserved* while
+a background enhancement for it is queued, and marked *started* once it
+runs upstream; ``take`` with ``wait`` then blocks on that work instead of
+sending a duplicate request. A reservation that has not started yet can be
+cancelled.
+
+Submits are served only speculative results, each exactly once (``take``),
+so submitting the same form again still gets a fresh enhancement. Every
+other result is stored too, but only for exact-key lookups (``get``) and
+the degraded ``get_any`` fallback.
+
+Entries can also be indexed by ``prompt_key``, which ignores model and
+temperature, so an overloaded server can answer from any earlier result
+for the same prompt.
+"""
+
+import hashlib
+import threading
+import time
+from collections import OrderedDict
+
+MAX_ENTRIES = 256
+TTL_SECONDS = 3600
+
+
+def cache_key(api_key, model_name, framework_type, temperature, prompt):
+    digest = hashlib.sha256()
+    for part in (api_key, model_name, framework_type, f"{temperature:.2f}", prompt):
+        digest.update(part.encode("utf-8"))
+        digest.update(b"\0")
+    return digest.hexdigest()
+
+
+def prompt_key(api_key, framework_type, prompt):
+    """Model- and temperature-independent key, whitespace-insensitive"""
+    return cache_key(api_key, "*", framework_type, 0.0, " ".join(prompt.split()))
+
+
+class ResponseCache:
+    """Thread-safe LRU with expiry and in-flight reservations"""
+
+    def __init__(self, max_entries=MAX_ENTRIES, ttl=TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._pending = {}
+        self._started = set()
+        self._by_prompt = {}
+        self._lock = threading.Lock()
+
+    def get(self, key, wait=0):
+        """Cached result or None; waits up to ``wait`` seconds on a reservation"""
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None and wait:
+            pending.wait(wait)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                self._drop(key)
+                return None
+            self._entries.move_to_end(key)
+            return entry[1]
+
+    def take(self, key, wait=0):
+        """Unused speculative result or None; waits like ``get``.
+
+        The entry stays cached as an ordinary result, but is never served
+        by ``take`` again.
+        """
+        with self._lock:
+            pending = self._pending.get(key)
+        if pending is not None and wait:
+            pending.wait(wait)
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None or not entry[3]:
+                return None
+            if time.monotonic() - entry[0] > self.ttl:
+                self._drop(key)
+                return None
+            self._entries[key] = entry[:3] + (False,)
+            return entry[1]
+
+    def get_any(self, prompt):
+        """``(result, model_name)`` last stored under ``prompt_key`` ``prompt``, or None"""
+        with self._lock:
+            key, model_name = self._by_prompt.get(prompt, (None, None))
+        value = self.get(key) if key is not None else None
+        return (value, model_name) if value is not None else None
+
+    def is_pending(self, key, reservation=None):
+        """Whether ``key`` is reserved (by ``reservation``, if given)"""
+        with self._lock:
+            pending = self._pending.get(key)
+            return pending is not None and (reservation is None or pending is reservation)
+
+    def is_started(self, key):
+        with self._lock:
+            return key in self._started
+
+    def reserve(self, key):
+        """Mark ``key`` as being computed; None if reserved or an unused
+        speculative result is already cached.
+
+        Returns the reservation, which ``start`` and ``release`` check so a
+        cancelled worker cannot touch a later reservation of the same key.
+        """
+        with self._lock:
+            entry = self._entries.get(key)
+            if key in self._pending or (entry is not None and entry[3]):
+                return None
+            reservation = self._pending[key] = threading.Event()
+            return reservation
+
+    def start(self, key, reservation):
+        """Mark a reservation as running upstream; False if it was cancelled"""
+        with self._lock:
+            if self._pending.get(key) is not reservation:
+                return False
+            self._started.add(key)
+            return True
+
+    def cancel(self, key):
+        """Drop a reservation that has not started; True if one was dropped"""
+        with self._lock:
+            if key not in self._pending or key in self._started:
+                return False
+            self._release(key)
+            return True
+
+    def put(self, key, value, prompt=None, model_name=None, speculative=False):
+        """Store ``value``; ``prompt`` is an optional ``prompt_key`` alias
+        and ``model_name`` the model that produced it"""
+        with self._lock:
+            self._entries[key] = (time.monotonic(), value, prompt, speculative)
+            self._entries.move_to_end(key)
+            if prompt is not None:
+                self._by_prompt[prompt] = (key, model_name)
+            while len(self._entries) > self.max_entries:
+                self._drop(next(iter(self._entries)))
+            self._release(key)
+
+    def release(self, key, reservation=None):
+        """Drop a reservation without storing a result"""
+        with self._lock:
+            if reservation is None or self._pending.get(key) is reservation:
+                self._release(key)
+
+    def _drop(self, key):
+        prompt = self._entries.pop(key)[2]
+        if prompt is not None and self._by_prompt.get(prompt, (None,))[0] == key:
+            del self._by_prompt[prompt]
+
+    def _release(self, key):
+        self._started.discard(key)
+        pending = self._pending.pop(key, None)
+        if pending is not None:
+            pending.set()
+
+
+cache = ResponseCache()
@@ -0,0 +1,197 @@
+"""Fair, prioritised admission of upstream calls across sessions.
+
+Streamlit runs every session's script in its own thread, so without this
+each submit goes upstream immediately and one busy session can occupy all
+capacity. ``FairScheduler`` caps concurrent upstream calls and orders the
+waiting ones:
+
+* interactive work (form submits) always goes before batch work;
+* within a class, sessions are served round-robin, so a session with many
+  queued calls only gets every n-th slot;
+* once the queue is full, new calls are rejected immediately with
+  ``QueueFull`` instead of waiting behind work that cannot finish in time.
+"""
+
+import math
+import threading
+import time
+from collections import OrderedDict, deque
+from contextlib import contextmanager
+
+INTERACTIVE = 0
+BATCH = 1
+
+MAX_CONCURRENT = 4
+MAX_QUEUE = 32
+
+# Batch work may only fill this share of the queue
+BATCH_QUEUE_SHARE = 0.5
+
+# Seed for the per-call service time average, in seconds
+INITIAL_SERVICE_TIME = 15.0
+
+# The queue wait average halves every this many seconds without admissions
+QUEUE_WAIT_HALF_LIFE = 30.0
+
+
+class QueueFull(Exception):
+    """Raised when a call is rejected because the queue is at capacity"""
+
+    def __init__(self, retry_after):
+        super().__init__(f"Upstream queue is full, retry after {retry_after:.0f}s")
+        self.retry_after = retry_after
+
+
+class _Ticket:
+    __slots__ = ("session_id", "priority", "granted", "enqueued")
+
+    def __init__(self, session_id, priority):
+        self.session_id = session_id
+        self.priority = priority
+        self.granted = False
+        self.enqueued = time.monotonic()
+
+
+class FairScheduler:
+    """Bounded, per-session round-robin queue in front of upstream calls"""
+
+    def __init__(self, max_concurrent=MAX_CONCURRENT, max_queue=MAX_QUEUE):
+        self.max_concurrent = max_concurrent
+        self.max_queue = max_queue
+        self._cond = threading.Condition()
+        self._queues = {INTERACTIVE: OrderedDict(), BATCH: OrderedDict()}
+        self._queued = 0
+        self._running = 0
+        self._service_time = INITIAL_SERVICE_TIME
+        self._queue_wait = 0.0
+        self._queue_wait_at = time.monotonic()
+
+    @contextmanager
+    def slot(self, session_id, priority=INTERACTIVE, on_wait=None):
+        """Hold one upstream slot for the duration of the ``with`` block.
+
+        ``on_wait(position, eta_seconds)`` is called from the waiting thread,
+        without the scheduler lock held, roughly every half second while the
+        call is queued.
+        """
+        with self._cond:
+            limit = self.max_queue if priority == INTERACTIVE else int(self.max_queue * BATCH_QUEUE_SHARE)
+            if self._queued >= limit:
+                raise QueueFull(self._eta(self._queued))
+            ticket = _Ticket(session_id, priority)
+            self._queues[priority].setdefault(session_id, deque()).append(ticket)
+            self._queued += 1
+            self._dispatch()
+
+        try:
+            while True:
+                with self._cond:
+                    if ticket.granted:
+                        break
+                    if on_wait is None:
+                        self._cond.wait(timeout=0.5)
+                        continue
+                    position = self._position(ticket)
+                    eta = self._eta(position)
+                # UI work runs outside the lock so it never holds up admission
+                on_wait(position, eta)
+                with self._cond:
+                    if not ticket.granted:
+                        self._cond.wait(timeout=0.5)
+        except BaseException:
+            with self._cond:
+                if ticket.granted:
+                    self._running -= 1
+                else:
+                    self._remove(ticket)
+                self._dispatch()
+            raise
+
+        with self._cond:
+            now = time.monotonic()
+            self._queue_wait = 0.8 * self._decayed_wait(now) + 0.2 * (now - ticket.enqueued)
+            self._queue_wait_at = now
+
+        started = time.monotonic()
+        try:
+            yield
+        finally:
+            with self._cond:
+                self._running -= 1
+                self._service_time = 0.8 * self._service_time + 0.2 * (time.monotonic() - started)
+                self._dispatch()
+
+    def stats(self):
+        """Current queue depth, in-flight calls and smoothed timings.
+
+        ``queue_wait`` is the larger of the time-decayed admission wait
+        average and the age of the oldest waiting call, so it falls back
+        to zero once the queue drains even if nothing else is admitted.
+        """
+        with self._cond:
+            now = time.monotonic()
+            oldest = min(
+                (ticket.enqueued for lanes in self._queues.values() for lane in lanes.values() for ticket in lane),
+                default=now,
+            )
+            return {
+                "queued": self._queued,
+                "running": self._running,
+                "max_concurrent": self.max_concurrent,
+                "max_queue": self.max_queue,
+                "service_time": self._service_time,
+                "queue_wait": max(self._decayed_wait(now), now - oldest),
+            }
+
+    def _decayed_wait(self, now):
+        return self._queue_wait * 0.5 ** ((now - self._queue_wait_at) / QUEUE_WAIT_HALF_LIFE)
+
+    def _order(self):
+        """Waiting tickets in the order they would be dispatched"""
+        order = []
+        for priority in (INTERACTIVE, BATCH):
+            lanes = [list(lane) for lane in self._queues[priority].values()]
+            depth = max((len(lane) for lane in lanes), default=0)
+            for i in range(depth):
+                order.extend(lane[i] for lane in lanes if i < len(lane))
+        return order
+
+    def _position(self, ticket):
+        return self._order().index(ticket) + 1
+
+    def _eta(self, position):
+        return math.ceil(position / self.max_concurrent) * self._service_time
+
+    def _dispatch(self):
+        while self._running < self.max_concurrent and self._queued:
+            for priority in (INTERACTIVE, BATCH):
+                lanes = self._queues[priority]
+                if lanes:
+                    session_id, lane = next(iter(lanes.items()))
+                    ticket = lane.popleft()
+                    # Served session goes to the back of the rotation
+                    del lanes[session_id]
+                    if lane:
+                        lanes[session_id] = lane
+                    break
+            ticket.granted = True
+            self._queued -= 1
+            self._running += 1
+        self._cond.notify_all()
+
+    def _remove(self, ticket):
+        lanes = self._queues[ticket.priority]
+        lane = lanes.get(ticket.session_id)
+        if lane is not None and ticket in lane:
+            lane.remove(ticket)
+            self._queued -= 1
+            if not lane:
+                del lanes[ticket.session_id]
+
+
+# Upstream (OpenRouter) calls
+scheduler = FairScheduler()
+
+# In-process local models: one generation at a time, kept off upstream slots
+LOCAL_MAX_QUEUE = 8
+local_scheduler = FairScheduler(max_concurrent=1, max_queue=LOCAL_MAX_QUEUE)
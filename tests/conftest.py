@@ -0,0 +1,9 @@
+import os
+import sys
+import tempfile
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+# Keep lifecycle events from tests out of the app's log file
+os.environ.setdefault("PROMPTGEN_LOG_PATH", os.path.join(tempfile.mkdtemp(prefix="promptgen-"), "requests.jsonl"))
@@ -0,0 +1,41 @@
+import time
+
+import backends
+from scheduler import scheduler
+
+
+class SlowModel:
+    """Stands in for llama_cpp.Llama: one token every 20 ms, forever"""
+
+    def __init__(self):
+        self.closed = False
+        self.max_tokens = None
+
+    def create_chat_completion(self, messages, temperature, top_p, max_tokens, stream):
+        self.max_tokens = max_tokens
+        try:
+            while True:
+                time.sleep(0.02)
+                yield {"choices": [{"delta": {"content": "x"}}]}
+        finally:
+            self.closed = True
+
+
+PAYLOAD = {"model": "local/test", "messages": [], "temperature": 0.7, "top_p": 0.9, "max_tokens": 4000}
+
+
+def test_local_generation_stops_at_timeout(monkeypatch):
+    model = SlowModel()
+    monkeypatch.setattr(backends, "_model", model)
+    response = backends.LocalBackend().post("local://", headers={}, json=PAYLOAD, timeout=0.1)
+    assert response.status_code == 504
+    assert response.json()["error"]["code"] == "local_timeout"
+    assert model.closed
+    assert model.max_tokens == backends.LOCAL_MAX_TOKENS
+
+
+def test_local_calls_use_their_own_single_slot():
+    local = backends.scheduler_for("local/test")
+    assert local is not scheduler
+    assert local.max_concurrent == 1
+    assert backends.scheduler_for("openai/gpt-4o") is scheduler
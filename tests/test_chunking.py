@@ -0,0 +1,50 @@
+import pytest
+import requests
+
+import chunking
+from assets import AI_MODELS
+
+
+def _http_error(status):
+    response = requests.Response()
+    response.status_code = status
+    return requests.exceptions.HTTPError(response=response)
+
+
+@pytest.fixture
+def upstream(monkeypatch):
+    """Scripted request_completion: each call pops the next outcome"""
+    outcomes = []
+
+    def fake(headers, data, model_name, session_id, priority, **log_fields):
+        outcome = outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+    monkeypatch.setattr(chunking, "request_completion", fake)
+    monkeypatch.setattr(chunking.time, "sleep", lambda seconds: None)
+    return outcomes
+
+
+MODEL = next(iter(AI_MODELS))
+
+
+def test_map_call_retries_rate_limits(upstream):
+    upstream += [_http_error(429), requests.exceptions.ConnectionError(), "enhanced"]
+    result = chunking.map_reduce_enhance("short prompt", "key", MODEL, "RACE", session_id="retry")
+    assert result == "enhanced"
+    assert not upstream
+
+
+def test_map_call_does_not_retry_auth_errors(upstream):
+    upstream += [_http_error(401), "unused"]
+    with pytest.raises(chunking.ChunkFailed):
+        chunking.map_reduce_enhance("another prompt", "key", MODEL, "RACE", session_id="auth")
+    assert upstream == ["unused"]
+
+
+def test_only_prompts_over_the_context_are_split():
+    fits = {"fits": True, "prompt_tokens": 3900, "max_tokens": 4000}
+    assert not chunking.needs_chunking(fits)
+    assert chunking.needs_chunking({**fits, "fits": False})
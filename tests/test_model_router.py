@@ -0,0 +1,32 @@
+from model_router import ModelRouter
+
+
+def _record(router, model_name, calls, latency, ok, output_tokens=200):
+    for _ in range(calls):
+        router.record(model_name, latency, ok, output_tokens)
+
+
+def test_untried_models_are_picked_first():
+    router = ModelRouter()
+    _record(router, "fast", 5, 1.0, True)
+    assert router.choose(["fast", "new", "newer"]) == "new"
+
+
+def test_model_within_slo_beats_slow_and_failing_ones():
+    router = ModelRouter()
+    # Equal call counts give every model the same exploration bonus
+    _record(router, "good", 10, 2.0, True)
+    _record(router, "slow", 10, 60.0, True)
+    _record(router, "failing", 10, 1.0, False)
+    assert router.choose(["slow", "failing", "good"]) == "good"
+    assert router.fastest(["slow", "failing", "good"]) == "good"
+
+
+def test_summary_reflects_only_the_window_after_wraparound():
+    router = ModelRouter(window=4)
+    _record(router, "m", 6, 1.0, False)
+    _record(router, "m", 2, 3.0, True)
+    [row] = router.summary()
+    assert row["calls"] == 4
+    assert row["failure_rate"] == 0.5
+    assert row["p50_s"] == 3.0
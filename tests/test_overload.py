@@ -0,0 +1,61 @@
+import threading
+import time
+from types import SimpleNamespace
+
+from overload import FASTEST_FREE, NORMAL, REJECT, SHORT_OUTPUT, OverloadController
+from scheduler import FairScheduler
+
+
+def test_stale_queue_wait_decays_on_idle_scheduler(monkeypatch):
+    scheduler = FairScheduler()
+    scheduler._queue_wait = 29.0
+    controller = OverloadController(scheduler)
+    assert controller.level() == REJECT
+
+    # Nothing is admitted while rejecting; the signal must still fade
+    later = time.monotonic() + 300
+    monkeypatch.setattr("scheduler.time", SimpleNamespace(monotonic=lambda: later))
+    assert controller.level() == NORMAL
+
+
+def test_level_drops_once_queue_drains():
+    scheduler = FairScheduler(max_concurrent=1, max_queue=4)
+    controller = OverloadController(scheduler)
+    release = threading.Event()
+
+    def hold():
+        with scheduler.slot("holder"):
+            release.wait()
+
+    def wait_in_queue(session_id):
+        with scheduler.slot(session_id):
+            pass
+
+    threads = [threading.Thread(target=hold)]
+    threads += [threading.Thread(target=wait_in_queue, args=(f"s{i}",)) for i in range(3)]
+    for thread in threads:
+        thread.start()
+    deadline = time.monotonic() + 5
+    while scheduler.stats()["queued"] < 3 and time.monotonic() < deadline:
+        time.sleep(0.01)
+    assert controller.level() == SHORT_OUTPUT
+
+    release.set()
+    for thread in threads:
+        thread.join(timeout=5)
+    assert scheduler.stats()["queued"] == 0
+    assert controller.level() == NORMAL
+
+
+def test_busy_upstream_slots_degrade_without_rejecting():
+    scheduler = FairScheduler(max_concurrent=4)
+    scheduler._running = 4
+    controller = OverloadController(scheduler, FairScheduler(max_concurrent=1))
+    assert controller.level() == FASTEST_FREE
+
+
+def test_saturated_local_model_raises_the_level():
+    local = FairScheduler(max_concurrent=1, max_queue=8)
+    local._queued = 8
+    controller = OverloadController(FairScheduler(), local)
+    assert controller.level() == REJECT
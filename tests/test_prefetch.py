@@ -0,0 +1,33 @@
+import pytest
+
+import prefetch
+
+
+@pytest.fixture
+def submitted(monkeypatch):
+    jobs = []
+    monkeypatch.setattr(prefetch._pool, "submit", lambda *args: jobs.append(args))
+    return jobs
+
+
+def _speculate(model_name, allow_paid, budget=None):
+    return prefetch.speculate("prompt for " + model_name, "key", model_name, "RACE", None, None, 0.7,
+                              "s", budget or prefetch.new_budget(), allow_paid)
+
+
+def test_free_models_are_speculated(submitted):
+    assert _speculate("OpenRouter - Llama 3.1 8B (Free)", allow_paid=False)
+
+
+def test_paid_models_need_opt_in_and_budget(submitted):
+    assert not _speculate("OpenAI - GPT-3.5", allow_paid=False)
+    assert _speculate("OpenAI - GPT-3.5", allow_paid=True)
+    # Worst-case cost is above the spend limit
+    assert not _speculate("OpenAI - GPT-4", allow_paid=True)
+
+
+def test_unpriced_paid_model_is_never_speculated(submitted):
+    # Falls back to the zero-priced default spec
+    assert not _speculate("vendor/unlisted-model", allow_paid=False)
+    assert not _speculate("vendor/unlisted-model", allow_paid=True)
+    assert not submitted
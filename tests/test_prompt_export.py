@@ -0,0 +1,51 @@
+import io
+import json
+import os
+import zipfile
+
+import pytest
+
+import prompt_export
+from prompt_export import cached_bundle, history_item, iter_zip
+
+
+@pytest.fixture
+def items():
+    return [
+        history_item("RACE", "Model A", 0.7, "prompt ภาษาไทย 1", "result 1"),
+        history_item("BUILD", "Model B", 0.3, "prompt 2", "result 2"),
+    ]
+
+
+def test_zip_has_one_file_per_item_and_one_jsonl(items):
+    data = b"".join(iter_zip(items, ["md", "json", "jsonl"]))
+    with zipfile.ZipFile(io.BytesIO(data)) as archive:
+        assert archive.testzip() is None
+        names = archive.namelist()
+        lines = archive.read("history.jsonl").decode("utf-8").splitlines()
+    assert sorted(name for name in names if name != "history.jsonl") == sorted(
+        prompt_export.item_filename(item, index, fmt)
+        for index, item in enumerate(items, start=1) for fmt in ("md", "json")
+    )
+    assert names.count("history.jsonl") == 1
+    assert [json.loads(line)["prompt"] for line in lines] == [item["prompt"] for item in items]
+
+
+def test_unchanged_history_reuses_the_cached_bundle(items, tmp_path):
+    first = cached_bundle(items, ["txt", "jsonl"], cache_dir=str(tmp_path))
+    assert cached_bundle(items, ["jsonl", "txt"], cache_dir=str(tmp_path)) == first
+    assert zipfile.is_zipfile(first)
+
+    items.append(history_item("RACE", "Model A", 0.7, "prompt 3", "result 3"))
+    assert cached_bundle(items, ["txt", "jsonl"], cache_dir=str(tmp_path)) != first
+
+
+def test_failed_build_leaves_no_partial_file(items, tmp_path, monkeypatch):
+    def broken(items, formats):
+        yield b"PK"
+        raise OSError("disk full")
+
+    monkeypatch.setattr(prompt_export, "iter_zip", broken)
+    with pytest.raises(OSError):
+        cached_bundle(items, ["txt"], cache_dir=str(tmp_path))
+    assert os.listdir(tmp_path) == []
@@ -0,0 +1,21 @@
+import os
+import subprocess
+import sys
+
+from conftest import ROOT
+
+SCRIPT = os.path.join(ROOT, "benchmarks", "regression.py")
+
+
+def test_flows_match_synthetic_baseline(tmp_path):
+    # Own interpreter: the transport singleton is fixed at first import
+    env = dict(os.environ, PROMPTGEN_LOG_PATH=str(tmp_path / "requests.jsonl"))
+    env.pop("PROMPTGEN_REPLAY_SPEED", None)
+    out = subprocess.run(
+        [sys.executable, SCRIPT,
+         "--fixtures", os.path.join(ROOT, "benchmarks", "fixtures", "synthetic.jsonl"),
+         "--baseline", os.path.join(ROOT, "benchmarks", "synthetic_baseline.json")],
+        cwd=ROOT, env=env, capture_output=True, text=True, timeout=120,
+    )
+    assert out.returncode == 0, out.stdout + out.stderr
+    assert "FAIL" not in out.stdout
@@ -0,0 +1,22 @@
+import logging
+import os
+
+from request_log import _file_handler
+
+
+def test_log_file_is_opened_lazily(tmp_path):
+    path = tmp_path / "logs" / "requests.jsonl"
+    handler = _file_handler(str(path))
+    assert handler.baseFilename == str(path)
+    assert not path.exists()
+
+
+def test_unusable_log_path_falls_back(tmp_path):
+    # A regular file where the log directory should be
+    blocker = tmp_path / "blocker"
+    blocker.write_text("")
+    handler = _file_handler(str(blocker / "requests.jsonl"))
+    assert isinstance(handler, (logging.FileHandler, logging.NullHandler))
+    if isinstance(handler, logging.FileHandler):
+        assert not handler.baseFilename.startswith(str(blocker))
+        assert os.path.isdir(os.path.dirname(handler.baseFilename))
@@ -0,0 +1,49 @@
+from response_cache import ResponseCache
+
+
+def test_queued_reservation_is_cancelled_not_waited_on():
+    cache = ResponseCache()
+    reservation = cache.reserve("k")
+    assert cache.cancel("k")
+    assert not cache.is_pending("k")
+    # The cancelled worker is refused once it gets a slot
+    assert not cache.start("k", reservation)
+
+
+def test_started_reservation_is_joined():
+    cache = ResponseCache()
+    reservation = cache.reserve("k")
+    assert cache.start("k", reservation)
+    assert not cache.cancel("k")
+    assert cache.is_started("k")
+    cache.put("k", "result", speculative=True)
+    assert cache.take("k", wait=1) == "result"
+    assert not cache.is_started("k")
+
+
+def test_stale_worker_cannot_touch_a_later_reservation():
+    cache = ResponseCache()
+    stale = cache.reserve("k")
+    cache.cancel("k")
+    fresh = cache.reserve("k")
+    assert not cache.start("k", stale)
+    cache.release("k", stale)
+    assert cache.is_pending("k", fresh)
+
+
+def test_speculative_result_is_served_once():
+    cache = ResponseCache()
+    cache.put("k", "speculated", prompt="p", model_name="m", speculative=True)
+    assert cache.take("k") == "speculated"
+    assert cache.take("k") is None
+    # Still available to the degraded fallback
+    assert cache.get_any("p") == ("speculated", "m")
+
+
+def test_submitted_results_are_not_replayed():
+    cache = ResponseCache()
+    cache.put("k", "submitted", prompt="p", model_name="m")
+    assert cache.take("k") is None
+    assert cache.get_any("p") == ("submitted", "m")
+    # A stored submit result doesn't block speculating on the same key
+    assert cache.reserve("k") is not None
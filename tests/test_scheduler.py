@@ -0,0 +1,109 @@
+import threading
+import time
+
+import pytest
+
+from scheduler import BATCH, INTERACTIVE, FairScheduler, QueueFull
+
+
+class Held:
+    """Occupies the only slot of a one-slot scheduler until released"""
+
+    def __init__(self, scheduler):
+        self._release = threading.Event()
+        self._thread = threading.Thread(target=self._hold, args=(scheduler,))
+        self._thread.start()
+        _wait_for(lambda: scheduler.stats()["running"] == 1)
+
+    def _hold(self, scheduler):
+        with scheduler.slot("holder"):
+            self._release.wait()
+
+    def release(self):
+        self._release.set()
+        self._thread.join(timeout=5)
+
+
+def _wait_for(condition, timeout=5):
+    deadline = time.monotonic() + timeout
+    while not condition():
+        assert time.monotonic() < deadline, "timed out"
+        time.sleep(0.005)
+
+
+def _queue_in_order(scheduler, calls, served):
+    """Enqueue ``(session_id, priority)`` calls one by one, in order"""
+    threads = []
+    for session_id, priority in calls:
+        queued = scheduler.stats()["queued"]
+
+        def run(session_id=session_id, priority=priority):
+            with scheduler.slot(session_id, priority):
+                served.append(session_id)
+
+        thread = threading.Thread(target=run)
+        thread.start()
+        threads.append(thread)
+        _wait_for(lambda: scheduler.stats()["queued"] == queued + 1)
+    return threads
+
+
+def _serve(held, threads):
+    held.release()
+    for thread in threads:
+        thread.join(timeout=5)
+
+
+def test_sessions_are_served_round_robin():
+    scheduler = FairScheduler(max_concurrent=1)
+    held, served = Held(scheduler), []
+    threads = _queue_in_order(scheduler, [("A", INTERACTIVE)] * 3 + [("B", INTERACTIVE)], served)
+    _serve(held, threads)
+    assert served == ["A", "B", "A", "A"]
+
+
+def test_interactive_goes_before_batch():
+    scheduler = FairScheduler(max_concurrent=1)
+    held, served = Held(scheduler), []
+    threads = _queue_in_order(scheduler, [("batch", BATCH), ("submit", INTERACTIVE)], served)
+    _serve(held, threads)
+    assert served == ["submit", "batch"]
+
+
+def test_batch_share_is_limited_and_rejected_fast():
+    scheduler = FairScheduler(max_concurrent=1, max_queue=4)
+    held, served = Held(scheduler), []
+    threads = _queue_in_order(scheduler, [("b1", BATCH), ("b2", BATCH)], served)
+
+    started = time.monotonic()
+    with pytest.raises(QueueFull) as rejected:
+        with scheduler.slot("b3", BATCH):
+            pass
+    assert time.monotonic() - started < 0.1
+    assert rejected.value.retry_after > 0
+
+    # Interactive work may still use the rest of the queue
+    threads += _queue_in_order(scheduler, [("i1", INTERACTIVE)], served)
+    _serve(held, threads)
+    assert served == ["i1", "b1", "b2"]
+
+
+def test_waiter_that_raises_leaves_no_ticket_behind():
+    scheduler = FairScheduler(max_concurrent=1)
+    held = Held(scheduler)
+
+    class Rerun(Exception):
+        """Stands in for Streamlit stopping the script mid-wait"""
+
+    def on_wait(position, eta):
+        raise Rerun()
+
+    with pytest.raises(Rerun):
+        with scheduler.slot("rerun", on_wait=on_wait):
+            pass
+    assert scheduler.stats()["queued"] == 0
+
+    held.release()
+    assert scheduler.stats()["running"] == 0
+    with scheduler.slot("next"):
+        assert scheduler.stats()["running"] == 1
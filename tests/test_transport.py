@@ -0,0 +1,22 @@
+import json
+import time
+
+from transport import ReplayTransport, request_key
+
+PAYLOAD = {"model": "m", "messages": []}
+
+
+def _replay(tmp_path, speed):
+    entry = {"key": request_key(PAYLOAD), "status": 200, "reason": "OK",
+             "headers": {"Content-Type": "application/json"}, "chunks": [[200, "{}"]]}
+    path = tmp_path / "fixture.jsonl"
+    path.write_text(json.dumps(entry) + "\n", encoding="utf-8")
+    started = time.perf_counter()
+    ReplayTransport(str(path), speed).post("u", headers={}, json=PAYLOAD, timeout=1)
+    return time.perf_counter() - started
+
+
+def test_replay_speed_speeds_up(tmp_path):
+    assert 0.18 <= _replay(tmp_path, 1.0) < 0.3
+    assert _replay(tmp_path, 4.0) < 0.1
+    assert _replay(tmp_path, 0) < 0.05
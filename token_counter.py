@@ -0,0 +1,162 @@
+"""Per-model token counting, pricing and context-limit checks.
+
+None of the upstream tokenizers ship with the app (and most cannot be
+bundled), so counts come from calibrated estimators: text is split into
+script runs (Thai, Latin words, digits, symbols) and each run is costed with
+per-tokenizer-family ratios. Thai is the case that matters most here - the
+same sentence costs several times more tokens on GPT-3.5/4 than on Qwen.
+
+Counts are cached per line, so editing one line of a long field only
+re-costs that line; ``FieldTokenCounter`` additionally remembers the last
+result per form field.
+"""
+
+import math
+import re
+from functools import lru_cache
+
+from assets import AI_MODELS, FRAMEWORK_INSTRUCTIONS, LOCAL_CONTEXT, LOCAL_MODEL_PREFIX, LOCAL_MODELS, MAX_TOKENS
+
+# Approximate tokenizer behaviour per family:
+#   latin  - Latin characters per token inside a word
+#   thai   - Thai characters per token
+#   digits - digits per token
+#   symbol - tokens per emoji / other symbol
+TOKENIZER_FAMILIES = {
+    "cl100k": {"latin": 4.2, "thai": 0.9, "digits": 3, "symbol": 1.5},
+    "llama3": {"latin": 4.2, "thai": 2.2, "digits": 3, "symbol": 1.5},
+    "sentencepiece": {"latin": 3.6, "thai": 0.45, "digits": 1, "symbol": 3.0},
+    "qwen": {"latin": 4.0, "thai": 2.6, "digits": 1, "symbol": 1.5},
+    "claude": {"latin": 3.8, "thai": 1.4, "digits": 3, "symbol": 2.0},
+}
+
+# Context window, tokenizer family and price (USD per 1M tokens) per model id
+MODEL_SPECS = {
+    "deepseek/deepseek-r1-distill-llama-70b:free": {
+        "family": "llama3", "context": 8192, "prompt_price": 0.0, "completion_price": 0.0
+    },
+    "mistral/mistral-7b-instruct": {
+        "family": "sentencepiece", "context": 32768, "prompt_price": 0.03, "completion_price": 0.055
+    },
+    "meta-llama/llama-3.1-8b-instruct:free": {
+        "family": "llama3", "context": 131072, "prompt_price": 0.0, "completion_price": 0.0
+    },
+    "qwen/qwen-2.5-7b-instruct:free": {
+        "family": "qwen", "context": 32768, "prompt_price": 0.0, "completion_price": 0.0
+    },
+    "openai/gpt-3.5-turbo": {
+        "family": "cl100k", "context": 16385, "prompt_price": 0.5, "completion_price": 1.5
+    },
+    "openai/gpt-4": {
+        "family": "cl100k", "context": 8191, "prompt_price": 30.0, "completion_price": 60.0
+    },
+    "anthropic/claude-3.5-sonnet": {
+        "family": "claude", "context": 200000, "prompt_price": 3.0, "completion_price": 15.0
+    },
+}
+
+# Local models run on this machine: no per-token price, context set by the backend
+for _model_id in LOCAL_MODELS.values():
+    MODEL_SPECS[_model_id] = {"family": "qwen", "context": LOCAL_CONTEXT, "prompt_price": 0.0, "completion_price": 0.0}
+
+DEFAULT_SPEC = {"family": "cl100k", "context": 8192, "prompt_price": 0.0, "completion_price": 0.0}
+
+# Role markers and message framing added by the chat template
+MESSAGE_OVERHEAD = 8
+
+_RUNS = re.compile(r"[\u0e00-\u0e7f]+|[A-Za-z]+|[0-9]+|\s+|.", re.DOTALL)
+
+
+def model_spec(model_name):
+    """Spec for a display name from ``AI_MODELS`` (or a raw model id)"""
+    return MODEL_SPECS.get(AI_MODELS.get(model_name, model_name), DEFAULT_SPEC)
+
+
+def is_free_model(model_name):
+    """Whether calls cost nothing: an OpenRouter ``:free`` or a local model.
+
+    Decided from the model id, not the price table, whose fallback spec
+    has zero prices for models it doesn't know.
+    """
+    model_id = AI_MODELS.get(model_name, model_name)
+    return model_id.endswith(":free") or model_id.startswith(LOCAL_MODEL_PREFIX)
+
+
+@lru_cache(maxsize=8192)
+def _count_line(family, line):
+    ratios = TOKENIZER_FAMILIES[family]
+    tokens = 0.0
+    for run in _RUNS.findall(line):
+        first = run[0]
+        if first.isspace():
+            continue
+        if "\u0e00" <= first <= "\u0e7f":
+            tokens += len(run) / ratios["thai"]
+        elif first.isascii() and first.isalpha():
+            tokens += math.ceil(len(run) / ratios["latin"])
+        elif first.isascii() and first.isdigit():
+            tokens += math.ceil(len(run) / ratios["digits"])
+        elif first.isascii():
+            tokens += 1
+        else:
+            tokens += ratios["symbol"]
+    return math.ceil(tokens)
+
+
+def count_tokens(text, model_name):
+    """Estimated token count of ``text`` for the given model"""
+    if not text:
+        return 0
+    family = model_spec(model_name)["family"]
+    lines = text.split("\n")
+    return sum(_count_line(family, line) for line in lines) + len(lines) - 1
+
+
+def prompt_cost(tokens, model_name):
+    """USD cost of ``tokens`` prompt tokens"""
+    return tokens * model_spec(model_name)["prompt_price"] / 1_000_000
+
+
+def estimate_request(prompt, model_name, framework_type, max_tokens=MAX_TOKENS):
+    """Token budget and worst-case cost of one enhancement request.
+
+    ``fits`` is False when prompt plus completion budget exceed the model's
+    context window; such requests are rejected upstream anyway, so they
+    should not be sent.
+    """
+    spec = model_spec(model_name)
+    prompt_tokens = (
+        count_tokens(f"{FRAMEWORK_INSTRUCTIONS[framework_type]}:\n\n{prompt}", model_name)
+        + MESSAGE_OVERHEAD
+    )
+    cost = (
+        prompt_tokens * spec["prompt_price"] + max_tokens * spec["completion_price"]
+    ) / 1_000_000
+    return {
+        "prompt_tokens": prompt_tokens,
+        "max_tokens": max_tokens,
+        "context": spec["context"],
+        "fits": prompt_tokens + max_tokens <= spec["context"],
+        "cost": cost,
+    }
+
+
+class FieldTokenCounter:
+    """Remembers the last count per form field.
+
+    A field whose text and model are unchanged since the previous rerun is
+    answered from memory; changed fields only re-cost the lines that
+    changed, via the line cache behind ``count_tokens``.
+    """
+
+    def __init__(self):
+        self._fields = {}
+
+    def count(self, field_key, text, model_name):
+        cached = self._fields.get(field_key)
+        if cached and cached[0] == text and cached[1] == model_name:
+            return cached[2]
+        tokens = count_tokens(text, model_name)
+        self._fields[field_key] = (text, model_name, tokens)
+        return tokens
+
@@ -0,0 +1,183 @@
+"""HTTP transport for upstream calls, with record and replay modes.
+
+``PROMPTGEN_HTTP_MODE`` selects the mode:
+
+* ``live`` (default) - plain ``requests.post``;
+* ``record`` - live calls whose status, headers, body chunks and chunk
+  arrival times (or the transport error) are appended to the fixture file;
+* ``replay`` - no network; recorded exchanges are served back with their
+  original timing, sped up by ``PROMPTGEN_REPLAY_SPEED`` (2 replays twice
+  as fast, 0 disables sleeps).
+
+Fixtures are JSON Lines at ``PROMPTGEN_FIXTURES``, one exchange per line,
+keyed by a hash of the request payload. Exchanges sharing a key are replayed
+in recorded order, so a 429-then-200 retry sequence replays faithfully.
+"""
+
+import codecs
+import hashlib
+import json
+import os
+import threading
+import time
+from datetime import timedelta
+
+import requests
+
+DEFAULT_FIXTURES = os.path.join(os.path.dirname(os.path.abspath(__file__)), "benchmarks", "fixtures", "openrouter.jsonl")
+
+# Transport errors that can be recorded and re-raised on replay
+_ERRORS = {
+    "ConnectionError": requests.exceptions.ConnectionError,
+    "Timeout": requests.exceptions.Timeout,
+    "ReadTimeout": requests.exceptions.ReadTimeout,
+    "ConnectTimeout": requests.exceptions.ConnectTimeout,
+}
+
+
+class FixtureMissing(LookupError):
+    """Replay mode has no recorded exchange left for a request"""
+
+
+def request_key(payload):
+    """Stable key for a request body; credentials and headers are excluded"""
+    encoded = json.dumps(payload, sort_keys=True, ensure_ascii=False).encode("utf-8")
+    return hashlib.sha256(encoded).hexdigest()[:20]
+
+
+def build_response(url, status, reason, headers, body, first_byte_ms):
+    response = requests.Response()
+    response.status_code = status
+    response.reason = reason
+    response.url = url
+    response.headers.update(headers)
+    response.encoding = "utf-8"
+    response._content = body
+    response.elapsed = timedelta(milliseconds=first_byte_ms)
+    return response
+
+
+class LiveTransport:
+    """Pass-through to ``requests``.
+
+    Streams so that ``post`` returns once headers arrive and
+    ``response.elapsed`` is the time to first byte; the body is read when
+    the caller touches it.
+    """
+
+    def __init__(self):
+        self.requests_sent = 0
+
+    def post(self, url, headers, json, timeout):
+        self.requests_sent += 1
+        return requests.post(url, headers=headers, json=json, timeout=timeout, stream=True)
+
+
+class RecordingTransport(LiveTransport):
+    """Live calls, each appended to the fixture file as it completes"""
+
+    def __init__(self, path):
+        super().__init__()
+        self.path = path
+        self._lock = threading.Lock()
+
+    def post(self, url, headers, json, timeout):
+        self.requests_sent += 1
+        entry = {"key": request_key(json)}
+        started = time.perf_counter()
+        try:
+            response = requests.post(url, headers=headers, json=json, timeout=timeout, stream=True)
+            # Incremental decoding keeps Thai characters split across chunks intact
+            decoder = codecs.getincrementaldecoder("utf-8")(errors="replace")
+            chunks = []
+            for chunk in response.iter_content(chunk_size=None):
+                offset = round((time.perf_counter() - started) * 1000)
+                chunks.append([offset, decoder.decode(chunk)])
+            tail = decoder.decode(b"", final=True)
+            if tail:
+                chunks[-1][1] += tail
+        except requests.exceptions.RequestException as e:
+            entry.update(error=type(e).__name__, elapsed_ms=round((time.perf_counter() - started) * 1000))
+            self._write(entry)
+            raise
+
+        entry.update(
+            status=response.status_code,
+            reason=response.reason,
+            headers={"Content-Type": response.headers.get("Content-Type", "application/json")},
+            chunks=chunks,
+        )
+        self._write(entry)
+        body = "".join(text for _, text in chunks).encode("utf-8")
+        return build_response(url, response.status_code, response.reason, entry["headers"], body,
+                               response.elapsed.total_seconds() * 1000)
+
+    def _write(self, entry):
+        with self._lock:
+            os.makedirs(os.path.dirname(self.path) or ".", exist_ok=True)
+            with open(self.path, "a", encoding="utf-8") as fh:
+                fh.write(json.dumps(entry, ensure_ascii=False, separators=(",", ":")) + "\n")
+
+
+class ReplayTransport:
+    """Serves recorded exchanges offline with their original timing"""
+
+    def __init__(self, path, speed=1.0):
+        self.speed = speed
+        self.requests_sent = 0
+        self._lock = threading.Lock()
+        self._exchanges = {}
+        with open(path, encoding="utf-8") as fh:
+            for line in fh:
+                if line.strip():
+                    entry = json.loads(line)
+                    self._exchanges.setdefault(entry["key"], []).append(entry)
+        self._cursor = dict.fromkeys(self._exchanges, 0)
+
+    def rewind(self):
+        """Start every key's exchange sequence from the beginning again"""
+        with self._lock:
+            self._cursor = dict.fromkeys(self._exchanges, 0)
+            self.requests_sent = 0
+
+    def post(self, url, headers, json, timeout):
+        key = request_key(json)
+        with self._lock:
+            self.requests_sent += 1
+            sequence = self._exchanges.get(key, [])
+            index = self._cursor.get(key, 0)
+            if index >= len(sequence):
+                raise FixtureMissing(f"No recorded exchange left for request {key}")
+            self._cursor[key] = index + 1
+        entry = sequence[index]
+
+        started = time.perf_counter()
+        if "error" in entry:
+            self._wait_until(started, entry["elapsed_ms"])
+            raise _ERRORS.get(entry["error"], requests.exceptions.ConnectionError)("replayed " + entry["error"])
+
+        for offset, _ in entry["chunks"]:
+            self._wait_until(started, offset)
+        body = "".join(text for _, text in entry["chunks"]).encode("utf-8")
+        first_byte_ms = entry["chunks"][0][0] if entry["chunks"] else 0
+        return build_response(url, entry["status"], entry.get("reason", ""), entry["headers"], body, first_byte_ms)
+
+    def _wait_until(self, started, offset_ms):
+        if not self.speed:
+            return
+        remaining = offset_ms / 1000 / self.speed - (time.perf_counter() - started)
+        if remaining > 0:
+            time.sleep(remaining)
+
+
+def make_transport(mode=None, path=None):
+    mode = mode or os.environ.get("PROMPTGEN_HTTP_MODE", "live")
+    path = path or os.environ.get("PROMPTGEN_FIXTURES", DEFAULT_FIXTURES)
+    if mode == "record":
+        return RecordingTransport(path)
+    if mode == "replay":
+        return ReplayTransport(path, float(os.environ.get("PROMPTGEN_REPLAY_SPEED", "1.0")))
+    return LiveTransport()
+
+
+transport = make_transport()